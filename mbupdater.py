@@ -4,18 +4,33 @@ import concurrent.futures
 import threading
 import json
 import os
-import itertools
+import io
+import functools
 import shutil
+import stat
 import zipfile
+import zlib
+import hashlib
+import codecs
+import mmap
 import socket
+import select
 import time
-import io
 import sys
+import tempfile
 import re
+import logging
 import ctypes as _ct
-import urllib.request as _ureq
-import urllib.error as _uerr
+import urllib.parse as _uparse
+import http.client as _http
+import gzip as _gzip
+import ssl as _ssl
 from html.parser import HTMLParser as _HTMLParser
+import xml.etree.ElementTree as _ET
+
+# Diagnostics from the scraper, pinger and server list go to DEBUG and cost
+# nothing unless enabled, e.g. with logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 # ====================================================================
 # REQUIRED MODULES:
@@ -23,26 +38,273 @@ from html.parser import HTMLParser as _HTMLParser
 # pip install Pillow
 # ====================================================================
 
+def _fatal(message):
+    """Shows a startup error in a throwaway Tk root, then exits."""
+    import tkinter.messagebox as _messagebox
+    root_error = tk.Tk()
+    root_error.withdraw()
+    _messagebox.showerror("Error", message)
+    root_error.destroy()
+    sys.exit(1)
+
 try:
     from PIL import Image, ImageTk
 except ImportError:
-    root_error = tk.Tk()
-    root_error.withdraw()
-    tk.messagebox.showerror("Error", "The Pillow library is not installed. Please install it with 'pip install Pillow' and restart the application.")
-    sys.exit()
+    _fatal("The Pillow library is not installed. Please install it with 'pip install Pillow' and restart the application.")
+
+# ====================================================================
+# OPTIONAL MODULES:
+# Used when installed, with a stdlib fallback otherwise.
+# pip install orjson  (faster JSON parsing and cache-file writes)
+# ====================================================================
+
+try:
+    import orjson as _orjson
+    _json_loads = _orjson.loads  # Takes bytes directly; errors subclass json.JSONDecodeError
+    _json_dumps = lambda obj: _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj, indent=4).encode('utf-8')
 
 # --- stdlib replacement for requests ---
 class _Resp:
-    def __init__(self, code, body, hdrs):
+    def __init__(self, code, body, hdrs, raw=None, release=None):
         self.status_code = code
-        self.content = body
-        self.text = body.decode('utf-8', errors='replace')
+        self._content = body
         self.headers = hdrs
+        self.raw = raw  # open file-like body when stream=True, else None
+        self._release = release  # returns the connection to its pool
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = self.raw.read() if self.raw else b''
+            self.close()
+        return self._content
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
     def json(self):
-        return json.loads(self.content)
+        return _json_loads(self.content)
     def raise_for_status(self):
         if self.status_code >= 400:
             raise requests.exceptions.HTTPError(f"HTTP {self.status_code}", response=self)
+    def close(self):
+        # Release first: closing raw would hide whether the body was read to the end
+        if self._release:
+            self._release()
+            self._release = None
+        if self.raw:
+            self.raw.close()
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        self.close()
+
+class _AdaptiveLimit:
+    """
+    Concurrency cap that ramps up while requests succeed and halves when the
+    server pushes back (HTTP 403/429/503), so fan-out stays fast on good
+    connections without tripping rate limits.
+    """
+    _BACKOFF_CODES = (403, 429, 503)
+
+    def __init__(self, initial=4, maximum=30):
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.active = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self.active >= int(self.limit):
+                self._cond.wait()
+            self.active += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+
+    def record(self, status):
+        """Additive increase (one slot per `limit` successes), multiplicative decrease."""
+        with self._cond:
+            if status in self._BACKOFF_CODES:
+                self.limit = max(1.0, self.limit / 2)
+            elif status < 400 and self.limit < self.maximum:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                self._cond.notify()
+
+class _Session:
+    """
+    Keep-alive HTTP client: idle connections are pooled per host and reused,
+    so repeated GitHub/JKHub requests skip the TCP and TLS handshakes.
+    Connection failures are retried with exponential backoff.
+    """
+    _REDIRECT_CODES = (301, 302, 303, 307, 308)
+    _RETRY_STATUS_CODES = (502, 503, 504)
+
+    def __init__(self, pool_maxsize=32, max_retries=3, backoff_factor=0.3, per_host_limit=4, max_host_limit=30):
+        self.headers = {}
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.per_host_limit = per_host_limit
+        self.max_host_limit = max_host_limit
+        self._ssl_context = _ssl.create_default_context()
+        self._idle = {}         # (scheme, host, port) -> [idle connections]
+        self._host_slots = {}   # host -> _AdaptiveLimit capping concurrent requests
+        self._lock = threading.Lock()
+
+    def _slot(self, host):
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = _AdaptiveLimit(self.per_host_limit, self.max_host_limit)
+            return slot
+
+    def _acquire(self, key, connect_timeout):
+        """Returns (connection, reused): an idle pooled connection if any, else a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            return conn, True
+        # http.client enables TCP_NODELAY on connect, so small API
+        # requests are not held back by Nagle's algorithm
+        scheme, host, port = key
+        if scheme == 'https':
+            conn = _http.HTTPSConnection(host, port, timeout=connect_timeout, context=self._ssl_context)
+        else:
+            conn = _http.HTTPConnection(host, port, timeout=connect_timeout)
+        return conn, False
+
+    def _release(self, key, conn, response):
+        """
+        Pools conn if its response body was read to the end, else closes it.
+        Must run before anything else closes the response: http.client only
+        marks it closed by itself on reaching EOF, so isclosed() then means
+        drained, while a body abandoned midway would leave unread bytes on
+        the connection that the next request would parse as its status line.
+        """
+        if response.isclosed() and not response.will_close:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.pool_maxsize:
+                    idle.append(conn)
+                    return
+        response.close()
+        conn.close()
+
+    def _send(self, key, path, headers, timeout, method='GET', body=None):
+        # timeout is either one value or a (connect, read) pair, as in requests
+        connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        attempt = 0
+        while True:
+            conn, reused = self._acquire(key, connect_timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                conn.sock.settimeout(read_timeout)
+                response = conn.getresponse()
+            except (_http.HTTPException, OSError) as e:
+                conn.close()
+                # Servers drop idle keep-alive connections (JKHub does between
+                # refreshes); a pooled one that turns out dead is replaced at
+                # once rather than costing a retry and a backoff sleep
+                if reused and isinstance(e, ConnectionError):
+                    continue
+                if attempt == self.max_retries:
+                    raise requests.exceptions.RequestException(str(e)) from None
+                time.sleep(self.backoff_factor * (2 ** attempt))
+                attempt += 1
+                continue
+
+            # Transient gateway errors are retried rather than failing the update
+            if response.status in self._RETRY_STATUS_CODES and attempt < self.max_retries:
+                response.read()
+                self._release(key, conn, response)
+                time.sleep(self.backoff_factor * (2 ** attempt))
+                attempt += 1
+                continue
+            return conn, response
+
+    def get(self, url, headers=None, timeout=(5, 60), stream=False):
+        """
+        timeout may be a single value or a (connect, read) pair.
+        With stream=True the body is left unread on `.raw` so large downloads
+        can be copied straight to disk instead of being buffered in memory.
+        The connection returns to the pool when the response is closed.
+        """
+        return self.request('GET', url, headers=headers, timeout=timeout, stream=stream)
+
+    def post(self, url, json=None, data=None, headers=None, timeout=(5, 60)):
+        """POSTs raw bytes (data) or a JSON-encoded object (json)."""
+        headers = dict(headers or {})
+        if json is not None:
+            data = _json_dumps(json)
+            headers.setdefault('Content-Type', 'application/json')
+        return self.request('POST', url, headers=headers, timeout=timeout, data=data)
+
+    def request(self, method, url, headers=None, timeout=(5, 60), stream=False, data=None):
+        request_headers = {**self.headers, **(headers or {})}
+        request_headers.setdefault('Accept-Encoding', 'gzip, identity')
+
+        for _ in range(10):
+            parts = _uparse.urlsplit(url)
+            scheme = parts.scheme or 'https'
+            key = (scheme, parts.hostname, parts.port or (443 if scheme == 'https' else 80))
+            path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+
+            with self._slot(parts.hostname) as slot:
+                conn, r = self._send(key, path, request_headers, timeout, method, data)
+                slot.record(r.status)
+                location = r.getheader('Location')
+                if r.status in self._REDIRECT_CODES and location:
+                    r.read()
+                    self._release(key, conn, r)
+                    # As browsers do, a 303 (or a 301/302 after a POST) is followed with a GET
+                    if r.status == 303 or (r.status in (301, 302) and method == 'POST'):
+                        method, data = 'GET', None
+                        request_headers.pop('Content-Type', None)
+                    new_url = _uparse.urljoin(url, location)
+                    # Never forward credentials to a different host (e.g. the release CDN)
+                    if _uparse.urlsplit(new_url).hostname != parts.hostname:
+                        request_headers.pop('Authorization', None)
+                    url = new_url
+                    continue
+
+                gzipped = (r.getheader('Content-Encoding') or '').lower() == 'gzip'
+                release = lambda: self._release(key, conn, r)
+                if stream and r.status < 400:
+                    raw = _gzip.GzipFile(fileobj=r) if gzipped else r
+                    return _Resp(r.status, None, r.headers, raw=raw, release=release)
+
+                try:
+                    body = r.read()
+                except (_http.HTTPException, OSError) as e:
+                    conn.close()
+                    raise requests.exceptions.RequestException(str(e)) from None
+                release()
+                if gzipped:
+                    # One C-level inflate of the whole body; gzip.decompress
+                    # walks members through GzipFile on older Pythons
+                    try:
+                        body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+                    except zlib.error as e:
+                        raise requests.exceptions.RequestException(f"Bad gzip body from {url}: {e}") from None
+                resp = _Resp(r.status, body, r.headers)
+                if r.status >= 400:
+                    raise requests.exceptions.HTTPError(f"HTTP Error {r.status}: {r.reason}", response=resp)
+                return resp
+
+        raise requests.exceptions.RequestException(f"Too many redirects for {url}")
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
 
 class _Requests:
     class exceptions:
@@ -52,32 +314,66 @@ class _Requests:
                 super().__init__(msg)
                 self.response = response
 
+    Session = _Session
+
     @staticmethod
-    def get(url, headers=None, timeout=30, stream=False):  # noqa: stream kept for API compat
-        import gzip as _gzip, ssl as _ssl
-        ctx = _ssl.create_default_context()
-        req = _ureq.Request(url, headers=headers or {})
-        req.add_unredirected_header('Accept-Encoding', 'gzip, identity')
-        try:
-            with _ureq.urlopen(req, timeout=timeout, context=ctx) as r:
-                body = r.read()
-                if r.headers.get('Content-Encoding') == 'gzip':
-                    body = _gzip.decompress(body)
-                return _Resp(r.status, body, dict(r.headers))
-        except _uerr.HTTPError as e:
-            body = e.read()
-            resp = _Resp(e.code, body, dict(e.headers))
-            raise requests.exceptions.HTTPError(str(e), response=resp) from None
-        except _uerr.URLError as e:
-            raise requests.exceptions.RequestException(str(e)) from None
+    def get(url, headers=None, timeout=(5, 60), stream=False):
+        """One-off request on a throwaway session; prefer the shared SESSION."""
+        return _Session().get(url, headers=headers, timeout=timeout, stream=stream)
+
+    @staticmethod
+    def post(url, json=None, data=None, headers=None, timeout=(5, 60)):
+        """One-off POST on a throwaway session; prefer the shared SESSION."""
+        return _Session().post(url, json=json, data=data, headers=headers, timeout=timeout)
 
 requests = _Requests()
 
+# Fallback for any socket created without an explicit timeout, so a stalled
+# peer can never hang a worker thread indefinitely
+socket.setdefaulttimeout(30)
+
+# Shared keep-alive session used for every GitHub and JKHub request
+SESSION = requests.Session(pool_maxsize=32, max_retries=3, backoff_factor=0.3)
+# GitHub's API rejects requests that carry no User-Agent
+SESSION.headers['User-Agent'] = 'MBII-Community-Updater'
+# Sent with api.github.com calls only, to pin the documented JSON media type
+# and API version (and the token, once one is configured)
+GITHUB_API_HEADERS = {'Accept': 'application/vnd.github+json', 'X-GitHub-Api-Version': '2022-11-28'}
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+# GitHub's GraphQL API requires authentication; without a token the REST API is used
+GITHUB_TOKEN = None
+
+def set_github_token(token):
+    """
+    Authenticates later GitHub API calls with a personal access token, raising
+    the REST rate limit from 60 to 5000 requests an hour. A falsy token
+    reverts to anonymous requests.
+    """
+    global GITHUB_TOKEN
+    GITHUB_TOKEN = token or None
+    if GITHUB_TOKEN:
+        GITHUB_API_HEADERS['Authorization'] = f'Bearer {GITHUB_TOKEN}'
+    else:
+        GITHUB_API_HEADERS.pop('Authorization', None)
+
+set_github_token(os.environ.get('GITHUB_TOKEN'))
+# A repository's releases, newest first, with the assets a download needs
+RELEASES_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    releases(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { tagName releaseAssets(first: 20) { nodes { name downloadUrl } } }
+    }
+  }
+}
+"""
+
 # --- stdlib replacement for pygame.mixer ---
 class _MciMixer:
     _send = _ct.windll.winmm.mciSendStringW
     _volume = 0.16
     _file = None
+    _initialized = False
     _stop = threading.Event()
 
     @classmethod
@@ -85,10 +381,11 @@ class _MciMixer:
         cls._send(s, None, 0, 0)
 
     @classmethod
-    def init(cls): pass
+    def init(cls):
+        cls._initialized = True
 
     @classmethod
-    def get_init(cls): return True
+    def get_init(cls): return cls._initialized
 
     class music:
         @staticmethod
@@ -140,145 +437,520 @@ class _MciMixer:
 
 mixer = _MciMixer()
 
-# --- stdlib replacement for bs4.BeautifulSoup ---
+# --- HTML to xml.etree elements (lxml is excluded from the build) ---
 _VOID_TAGS = {'area','base','br','col','embed','hr','img','input','link','meta','param','source','track','wbr'}
+# Opening one of these closes the listed elements when they are innermost,
+# as HTML allows </td>, </tr> and friends to be omitted
+_IMPLIED_END_TAGS = {
+    'td': ('td', 'th'),
+    'th': ('td', 'th'),
+    'tr': ('td', 'th', 'tr'),
+    'li': ('li',),
+    'option': ('option',),
+    'p': ('p',),
+}
 
-class _El:
-    __slots__ = ('tag', 'attrs', 'children')
-    def __init__(self, tag, attrs):
-        self.tag = tag
-        self.attrs = dict(attrs)
-        self.children = []
-
-    @property
-    def text(self):
-        return ''.join(c.text if isinstance(c, _El) else c for c in self.children).strip()
-
-    def get_text(self, separator='', strip=False):
-        t = separator.join(c.text if isinstance(c, _El) else c for c in self.children)
-        return t.strip() if strip else t
-
-    def get(self, k, d=''):
-        v = self.attrs.get(k)
-        if v is None:
-            return d
-        return v.split() if k == 'class' else v
-
-    def find(self, tag):
-        for c in self.children:
-            if not isinstance(c, _El): continue
-            if c.tag == tag: return c
-            r = c.find(tag)
-            if r: return r
-        return None
-
-    def find_all(self, tag):
-        out = []
-        for c in self.children:
-            if not isinstance(c, _El): continue
-            if c.tag == tag: out.append(c)
-            out.extend(c.find_all(tag))
-        return out
-
-    def __str__(self):
-        a = ''.join(f' {k}="{v}"' for k, v in self.attrs.items())
-        inner = ''.join(str(c) for c in self.children)
-        return f'<{self.tag}{a}>{inner}</{self.tag}>'
-
-class _SoupParser(_HTMLParser):
-    def __init__(self):
+class _EtreeHTMLParser(_HTMLParser):
+    """
+    Feeds html.parser events into the C-accelerated ElementTree.TreeBuilder,
+    so elements are native Element objects searchable with ElementPath
+    (find/iterfind/iter) instead of a Python node class per tag.
+    """
+    def __init__(self, only_tag=None):
         super().__init__()
-        self._root = _El('root', [])
-        self._stack = [self._root]
+        self._builder = _ET.TreeBuilder()
+        self._builder.start('root', {})
+        self._open = []  # tags currently open below the root
+        self._only = only_tag
+    def _close_innermost(self):
+        self._builder.end(self._open.pop())
     def handle_starttag(self, tag, attrs):
-        el = _El(tag, attrs)
-        self._stack[-1].children.append(el)
-        if tag not in _VOID_TAGS:
-            self._stack.append(el)
+        # Outside the wanted element, skip building nodes entirely
+        if self._only and not self._open and tag != self._only:
+            return
+        closes = _IMPLIED_END_TAGS.get(tag)
+        while closes and self._open and self._open[-1] in closes:
+            self._close_innermost()
+        self._builder.start(tag, {k: v if v is not None else '' for k, v in attrs})
+        if tag in _VOID_TAGS:
+            self._builder.end(tag)
+        else:
+            self._open.append(tag)
     def handle_endtag(self, tag):
-        if len(self._stack) > 1 and self._stack[-1].tag == tag:
-            self._stack.pop()
+        # Close up to the matching element; stray end tags are ignored
+        if tag in self._open:
+            while self._open[-1] != tag:
+                self._close_innermost()
+            self._close_innermost()
     def handle_data(self, data):
-        self._stack[-1].children.append(data)
-
-def BeautifulSoup(html, parser='html.parser'):  # noqa: parser kept for API compat
-    p = _SoupParser()
-    p.feed(html)
-    return p._root
-
+        if self._only and not self._open:
+            return
+        self._builder.data(data)
+    def close(self):
+        super().close()
+        while self._open:
+            self._close_innermost()
+        self._builder.end('root')
+        return self._builder.close()
+
+# Small enough that parsing starts well before a typical page finishes downloading
+_FEED_CHUNK_SIZE = 64 * 1024
+
+def parse_html(markup, only_tag=None, encoding=None):
+    """
+    Parses HTML into an xml.etree 'root' Element. markup may be a string or
+    a binary file object; a file object is decoded and fed in chunks as it
+    is read, so parsing overlaps the download. With only_tag, nothing
+    outside elements of that tag is built.
+    """
+    p = _EtreeHTMLParser(only_tag)
+    if isinstance(markup, str):
+        p.feed(markup)
+    else:
+        try:
+            decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        for chunk in iter(lambda: markup.read(_FEED_CHUNK_SIZE), b''):
+            p.feed(decoder.decode(chunk))
+        p.feed(decoder.decode(b'', final=True))
+    return p.close()
+
+def _element_text(element):
+    """All text inside element, stripped (BeautifulSoup's .text)."""
+    return ''.join(element.itertext()).strip()
+
+# PyInstaller unpacks bundled resources to sys._MEIPASS; otherwise use the working directory
+_RESOURCE_BASE = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+@functools.lru_cache(maxsize=256)
 def get_resource_path(filename):
     """Returns the correct path for PyInstaller-bundled resources."""
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, filename)
-    return os.path.join(os.path.abspath("."), filename)
+    return os.path.join(_RESOURCE_BASE, filename)
+
+def is_rate_limit_response(response):
+    """
+    True if a GitHub error response is a rate limit. GitHub reports this in
+    headers (an exhausted X-RateLimit-Remaining, or Retry-After for the
+    secondary limit), so other 403s such as a private repository are not
+    mistaken for one and the body never needs to be inspected.
+    """
+    if response is None:
+        return False
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and (
+        response.headers.get('X-RateLimit-Remaining') == '0'
+        or response.headers.get('Retry-After') is not None
+    )
+
+@functools.lru_cache(maxsize=256)
+def split_repo_url(repo_url):
+    """
+    Returns (owner, repo) for a GitHub repository URL, memoized so repeated
+    colour refreshes and API calls don't re-split the same URLs.
+    Raises IndexError if the URL has no owner segment.
+    """
+    parts = repo_url.rstrip('/').split('/')
+    return parts[-2], parts[-1]
+
+# Music setting changes reach client.json this long after the last one
+CLIENT_SAVE_DELAY_MS = 2000
+
+def write_file_atomic(file_path, data):
+    """
+    Writes bytes to file_path through a temporary sibling and os.replace, so
+    a crash mid-write leaves the previous file intact instead of a truncated
+    one. The temporary name is per thread, so concurrent saves don't clash.
+    """
+    tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 def read_json_file(file_path):
     """Safely reads a JSON file."""
     if not os.path.exists(file_path):
         return None
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _json_loads(f.read())
     except Exception as e:
         print(f"Error reading JSON file {file_path}: {e}")
         return None
 
-def extract_zip_contents(zip_data, target_directory):
+class HttpValidatorCache:
+    """
+    Persists per-URL HTTP cache validators (ETag / Last-Modified) to a JSON
+    file so later runs can send conditional requests and receive a bodyless
+    304 Not Modified when nothing changed upstream.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._entries = read_json_file(file_path) or {}
+
+    def get(self, url):
+        """Returns the stored entry for url, or an empty dict."""
+        with self._lock:
+            return dict(self._entries.get(url, {}))
+
+    def conditional_headers(self, url):
+        """Builds If-None-Match / If-Modified-Since headers for url."""
+        entry = self.get(url)
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response_headers, **extra):
+        """Records the validators from a 200 response (plus any extra fields) and saves."""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if not etag and not last_modified and not extra:
+            return
+        with self._lock:
+            self._entries[url] = {'etag': etag, 'last_modified': last_modified, **extra}
+            self._save()
+
+    def _save(self):
+        try:
+            write_file_atomic(self.file_path, _json_dumps(self._entries))
+        except IOError as e:
+            print(f"Error writing HTTP cache {self.file_path}: {e}")
+
+# Decoded, resized PIL images keyed by (path, size)
+_resized_images = {}
+_resized_images_lock = threading.Lock()
+
+def load_resized_image(path, size=None):
+    """
+    Decodes an image with Pillow and resizes it (unless size is None),
+    caching the result per (path, size). This is CPU-bound, so call it from
+    a worker thread and wrap the result in ImageTk.PhotoImage on the Tk thread.
+    """
+    key = (path, size)
+    with _resized_images_lock:
+        cached = _resized_images.get(key)
+    if cached is None:
+        with Image.open(path) as pil_image:
+            if size:
+                cached = pil_image.resize(size, Image.LANCZOS)
+            else:
+                pil_image.load()
+                cached = pil_image.copy()
+        with _resized_images_lock:
+            _resized_images[key] = cached
+    return cached
+
+# Chunk size for streaming downloads and extracted members to disk (1 MiB)
+COPY_CHUNK_SIZE = 1024 * 1024
+# Downloaded archives up to this size are spooled in RAM rather than to a temp file
+SPOOL_MAX_MEMORY = 32 * 1024 * 1024
+# Release asset types the updater can install (str.endswith accepts the tuple as-is)
+_ASSET_EXTS = ('.zip',)
+# Number of archive members extracted concurrently
+MAX_EXTRACT_THREADS = min(8, os.cpu_count() or 4)
+
+# Shared worker pool for network fetches (release checks, downloads)
+DOWNLOAD_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.environ.get("MBII_DL_THREADS", "16")),
+    thread_name_prefix="mbii-dl"
+)
+
+# Small dedicated pool for per-repository GitHub API lookups, so a long
+# repository list queues behind a few keep-alive connections instead of
+# opening many at once and tripping GitHub's secondary rate limit. Up to 8
+# lookups may be in flight; the Session's adaptive per-host limit holds them
+# back further if GitHub starts answering 403/429
+GITHUB_API_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="mbii-gh")
+
+def _log_task_failure(future):
+    """Done callback for fire-and-forget pool tasks: reports an uncaught exception."""
+    if not future.cancelled() and future.exception() is not None:
+        error = future.exception()
+        logger.error("Background task failed", exc_info=(type(error), error, error.__traceback__))
+
+def submit_background(fn, *args):
+    """
+    Runs `fn(*args)` on DOWNLOAD_POOL for callers that never look at the
+    returned future, logging any exception instead of letting it vanish.
+    """
+    future = DOWNLOAD_POOL.submit(fn, *args)
+    future.add_done_callback(_log_task_failure)
+    return future
+
+def compare_release_tags(local_tag, latest_tag):
+    """
+    Returns (status_string, latest_tag_name) for installed content. A missing
+    remote tag means the latest release could not be determined, which is
+    treated as up to date so the server can still be joined.
+    """
+    if not latest_tag:
+        return 'up-to-date', local_tag
+    if local_tag == latest_tag:
+        return 'up-to-date', latest_tag
+    return 'outdated', latest_tag
+
+def spool_response_to_tempfile(response):
+    """
+    Copies a streamed HTTP response body into an anonymous temporary file
+    so a ZIP archive can be opened from disk instead of from memory.
+
+    A ZIP's central directory sits at the end of the archive, so members
+    cannot be located until the whole file has arrived; spooling to disk
+    keeps that random access without buffering the archive in RAM. Each
+    member is then inflated incrementally by `ZipFile.open`. Archives that
+    announce a Content-Length of at most SPOOL_MAX_MEMORY skip the disk
+    round trip and are spooled into memory instead.
+
+    Args:
+        response: A response obtained with `SESSION.get(..., stream=True)`.
+
+    Returns:
+        file: The temporary file (or BytesIO), rewound to the start. Deleted on close.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    length = headers.get('Content-Length') or ''
+    in_memory = (length.isdigit() and int(length) <= SPOOL_MAX_MEMORY
+                 and not headers.get('Content-Encoding'))
+    tmp = io.BytesIO() if in_memory else tempfile.TemporaryFile()
+    try:
+        if length.isdigit() and not in_memory:
+            # Reserve the announced size up front, as extraction does per member
+            tmp.truncate(int(length))
+        _copy_stream(response.raw, tmp)
+        tmp.truncate()  # Drop any reserved tail a short body didn't fill
+        tmp.seek(0)
+    except Exception:
+        tmp.close()
+        raise
+    finally:
+        response.close()
+    return tmp
+
+# One reusable COPY_CHUNK_SIZE buffer per thread for readinto-based copies
+_scratch = threading.local()
+
+def _scratch_view():
+    """Returns this thread's scratch buffer (a memoryview), allocating it once."""
+    view = getattr(_scratch, 'view', None)
+    if view is None:
+        view = _scratch.view = memoryview(bytearray(COPY_CHUNK_SIZE))
+    return view
+
+def _copy_stream(src, dst):
+    """Like shutil.copyfileobj, but fills one reused buffer instead of allocating per chunk."""
+    view = _scratch_view()
+    readinto, write = src.readinto, dst.write
+    while True:
+        n = readinto(view)
+        if not n:
+            break
+        write(view[:n])
+
+def _file_crc32(file_path):
+    """Computes the CRC32 of a file on disk, reading it in COPY_CHUNK_SIZE chunks."""
+    crc = 0
+    view = _scratch_view()
+    with open(file_path, 'rb') as f:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            crc = zlib.crc32(view[:n], crc)
+    return crc
+
+def _is_unchanged(info, dest_path):
+    """True when dest_path already holds exactly the member's bytes (same size and CRC32)."""
+    try:
+        return os.path.getsize(dest_path) == info.file_size and _file_crc32(dest_path) == info.CRC
+    except OSError:
+        return False
+
+def _extract_member(zf, info, dest_path):
+    """Streams a single archive member (a ZipInfo) to dest_path; its folder must exist."""
+    # Incremental updates mostly repeat files already on disk; hashing is far
+    # cheaper than inflating and rewriting them
+    if _is_unchanged(info, dest_path):
+        return
+
+    # Stream the file content without materializing it as bytes
+    with zf.open(info) as src, open(dest_path, 'wb', buffering=COPY_CHUNK_SIZE) as outfile:
+        # Size the file upfront so the filesystem can allocate contiguous extents
+        if info.file_size:
+            outfile.truncate(info.file_size)
+        _copy_stream(src, outfile)
+
+    # Keep Unix permission bits from archives built on Linux/macOS, but never
+    # leave a file read-only, or the next update could not overwrite it
+    mode = (info.external_attr >> 16) & 0o777
+    if mode:
+        os.chmod(dest_path, mode | stat.S_IWUSR)
+
+class _MappedArchive:
+    """
+    Read-only memory map over an open archive file, exposing the small
+    file-like API ZipFile needs (mmap itself only gains seekable() in 3.13).
+    Member reads are served from the page cache without read() syscalls.
+    """
+
+    def __init__(self, f):
+        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, n=-1):
+        return self._map.read(n)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        self._map.seek(offset, whence)
+        return self._map.tell()
+
+    def tell(self):
+        return self._map.tell()
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class _MappedZipFile(zipfile.ZipFile):
+    """ZipFile over a _MappedArchive that releases the map when closed."""
+
+    def __init__(self, f):
+        self._mapped = _MappedArchive(f)
+        try:
+            super().__init__(self._mapped, 'r')
+        except Exception:
+            self._mapped.close()
+            raise
+
+    def close(self):
+        super().close()
+        # Unmap before the underlying temp file is closed, which Windows requires
+        self._mapped.close()
+
+def open_spooled_archive(spooled):
+    """
+    Opens a spooled archive (see spool_response_to_tempfile) as a ZipFile,
+    memory-mapping it when it is a non-empty file on disk. The caller still
+    owns `spooled` and must close it after the ZipFile.
+    """
+    if isinstance(spooled, io.BytesIO):
+        return zipfile.ZipFile(spooled, 'r')
+    if os.fstat(spooled.fileno()).st_size == 0:
+        return zipfile.ZipFile(spooled, 'r')  # Raises BadZipFile; mmap cannot map 0 bytes
+    return _MappedZipFile(spooled)
+
+def _extract_jobs(zf, jobs):
+    """
+    Streams (ZipInfo, dest_path) pairs out of an open ZipFile in parallel,
+    creating each target subdirectory once beforehand.
+    """
+    for directory in {os.path.dirname(dest_path) for _, dest_path in jobs}:
+        os.makedirs(directory, exist_ok=True)
+
+    # Inflate and file writes release the GIL, so workers overlap usefully
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_EXTRACT_THREADS) as executor:
+        list(executor.map(lambda job: _extract_member(zf, *job), jobs))
+
+def extract_zip_contents(zip_source, target_directory):
     """
     Extracts the contents of a ZIP file, stripping the common root directory 
     (e.g., 'MBII/') to prevent unwanted nested folders (e.g., /Target/MBII/MBII).
+
+    Members are streamed to disk one at a time, so peak memory is bounded by
+    the copy buffer rather than by the archive or member size.
+
+    Not called by the installer: download_release_by_tag extracts release
+    archives itself, keeping full member names and recording them for removal.
     
     Args:
-        zip_data (bytes): The content of the zip file as bytes.
+        zip_source: A path to the zip file, an open binary file object (a
+            non-seekable one such as `response.raw` is spooled first), or a
+            response obtained with `SESSION.get(..., stream=True)`.
         target_directory (str): The final destination folder.
     """
+    spooled = None
     try:
-        # 1. Open the zip archive from the byte stream
-        with zipfile.ZipFile(io.BytesIO(zip_data), 'r') as zf:
+        # 1. Open the zip archive, spooling a streamed download to disk first
+        if hasattr(zip_source, 'raw'):
+            zip_source = spooled = spool_response_to_tempfile(zip_source)
+        elif hasattr(zip_source, 'read') and not zip_source.seekable():
+            # ZipFile must seek to the central directory at the end
+            spooled = tempfile.TemporaryFile()
+            _copy_stream(zip_source, spooled)
+            spooled.seek(0)
+
+        with (open_spooled_archive(spooled) if spooled else zipfile.ZipFile(zip_source, 'r')) as zf:
             
-            name_list = zf.namelist()
-            if not name_list:
+            # ZipInfo objects open directly, skipping a name lookup per member
+            infos = zf.infolist()
+            if not infos:
                 return # Zip is empty
 
-            # 2. Identify the common root directory
-            # Finds the longest common prefix (e.g., 'MBII/').
-            root_dir = os.path.commonprefix(name_list)
-            
-            # Ensure the root_dir is a single-level directory name ending with a separator
-            # If the path is complicated (e.g., 'mod/MBII/'), we treat it as no root.
-            if not root_dir.endswith('/') or root_dir.count('/') > 1:
-                 # If no clear single root directory, set root_dir to empty
+            # 2. Identify the common root directory (e.g., 'MBII/')
+            # Compared on whole path components: a character-level prefix would
+            # treat 'MBII/' and 'MBIIa/file' as sharing 'MBII'. The first entry's
+            # top folder (slash included) is the only candidate; the check
+            # stops at the first entry outside it. A lone entry such as
+            # 'MBII/x.pk3' is not a root folder and keeps its path.
+            segment, separator, _ = infos[0].filename.partition('/')
+            root_dir = segment + separator if segment and separator and len(infos) > 1 else ''
+            if root_dir and not all(info.filename.startswith(root_dir) for info in infos):
+                # If no clear single root directory, set root_dir to empty
                 root_dir = ''
-
-            # 3. Extract all files, modifying the path
-            for member in name_list:
-                
-                # Calculate the new path by stripping the root directory
-                if root_dir and member.startswith(root_dir):
-                    # Strip the root directory (e.g., 'MBII/file' becomes 'file')
-                    arcname = member[len(root_dir):]
-                else:
-                    arcname = member
+            strip = len(root_dir)
+
+            # 3. Build the list of files to extract, modifying the path
+            # Strip the root directory (e.g., 'MBII/file' becomes 'file')
+            # and rewrite it onto the target, refusing anything that would
+            # land outside it, as ZipFile.extractall does
+            target_root = os.path.abspath(target_directory)
+            abspath, join = os.path.abspath, os.path.join
+            jobs = []
+            append = jobs.append
+            for info in infos:
+                arcname = info.filename[strip:]
                 
                 # Skip empty paths (the root folder itself) or directories
                 if not arcname or arcname.endswith('/'):
                     continue
 
                 # The full extraction path
-                dest_path = os.path.join(target_directory, arcname)
-                
-                # Ensure the target subdirectory exists
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                
-                # Extract the file content
-                with open(dest_path, 'wb') as outfile:
-                    outfile.write(zf.read(member))
+                dest_path = abspath(join(target_root, arcname))
+                if not dest_path.startswith(target_root + os.sep):
+                    continue
+                append((info, dest_path))
+
+            # 4. Stream the files out in parallel (each member through
+            # ZipFile.open and one reused buffer, never whole via zf.read)
+            _extract_jobs(zf, jobs)
 
         print(f"Extraction successful: files extracted directly to {target_directory}.")
 
     except Exception as e:
         # Provide user feedback on the error
         tk.messagebox.showerror("Extraction Error", f"Failed to extract content: {e}")
+    finally:
+        if spooled:
+            spooled.close()
 
 # ====================================================================
 # NEW MASTER SERVER DEFINITIONS
@@ -294,163 +966,298 @@ MASTER_SERVERS = {
 }
 
 QUERY_PACKET = b'\xff\xff\xff\xffgetstatus\n'
+# Replies are only timed, never read, so they all land in one reusable buffer.
+# It must hold a whole datagram: Windows fails recv with WSAEMSGSIZE otherwise.
+_PING_BUF = bytearray(2048)
+# Receive and send buffer size for the batch ping socket (the OS default is often only 64 KB)
+PING_SOCKBUF_SIZE = 1024 * 1024
+
+class _SanitizeTable(dict):
+    """
+    str.translate table that keeps a-z, 0-9 and spaces, maps non-breaking and
+    em spaces to plain spaces and deletes everything else. Each code point's
+    entry is filled in on first sight, so later lookups stay in C.
+    """
+    _KEEP = frozenset(map(ord, 'abcdefghijklmnopqrstuvwxyz0123456789 '))
+
+    def __missing__(self, code_point):
+        mapped = code_point if code_point in self._KEEP else None
+        self[code_point] = mapped
+        return mapped
+
+_SANITIZE_TABLE = _SanitizeTable({ord('\xa0'): ' ', ord('\u2003'): ' '})
+
+# "host:port" as scraped from the server list
+_ADDR_RE = re.compile(r'(.*):([0-9]+)')
 
 def ping_server(ip, port, timeout=0.3):
     """
     Pings a Quake 3/JKA server using the standard UDP query protocol 
     to get a more reliable latency measurement.
+
+    Returns:
+        int: Latency in ms, 999 on timeout or -1 on error. Lists of servers
+        should use ping_server_batch, which pings them all concurrently
+        from one socket instead of one blocking socket each.
     """
-    try:
-        # Use SOCK_DGRAM for UDP
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(timeout)
-        
-        # 1. Send the query packet
-        start_time = time.time()
-        sock.sendto(QUERY_PACKET, (ip, port))
-        
-        # 2. Wait for a response (which includes the ping time implicitly)
-        sock.recv(2048) # Read the response packet
-        
-        end_time = time.time()
-        
-        # Calculate latency in milliseconds and round it
-        latency_ms = round((end_time - start_time) * 1000)
-        
-        sock.close()
-        return latency_ms
+    return ping_server_batch([(ip, port)], timeout).get((ip, port), -1)
 
-    except socket.timeout:
-        # A timeout here means the server didn't respond to the official query
-        return 999
-    except Exception:
-        # General error (firewall, routing issue, etc.)
-        return -1
 
+def ping_server_batch(targets, timeout=0.3):
+    """
+    Pings many Quake 3/JKA servers from a single non-blocking UDP socket:
+    every query is sent in one tight loop, then replies are collected with
+    select() and matched back to their target by source address. The whole
+    batch takes roughly one timeout window, without a socket or thread per
+    server.
+
+    Args:
+        targets (iterable): (ip, port) tuples. Hostnames are resolved first.
+        timeout (float): Seconds to wait for each reply after its query.
+
+    Returns:
+        dict: (ip, port) -> latency in ms, 999 on timeout or -1 on error,
+        with the same meaning as ping_server.
+    """
+    results = {}
+    pending = {}  # resolved (ip, port) -> original targets that share it
+    for target in targets:
+        ip, port = target
+        try:
+            # Scraped addresses are nearly always IPv4 literals; only real
+            # hostnames pay for a blocking DNS lookup
+            try:
+                resolved = socket.inet_ntoa(socket.inet_pton(socket.AF_INET, ip))
+            except OSError:
+                resolved = socket.gethostbyname(ip)
+        except OSError:
+            results[target] = -1
+            continue
+        pending.setdefault((resolved, port), []).append(target)
+
+    if not pending:
+        return results
+
+    send_times = {}
+    # Plain select() on the one socket: a selectors object would add epoll
+    # setup and teardown syscalls (on Linux) for no benefit
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.setblocking(False)
+        # Hundreds of replies can land within a few milliseconds; a roomy receive
+        # buffer keeps the kernel from dropping them before the loop drains it,
+        # and a matching send buffer lets the whole burst of queries be queued
+        for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, option, PING_SOCKBUF_SIZE)
+            except OSError:
+                pass
+        watched = [sock]
+
+        # 1. Fire every query, pausing briefly every 64 sends so bursts do not
+        #    overrun the send buffer or stall on ARP resolution. Should the
+        #    buffer fill anyway, wait until it drains instead of reporting
+        #    the server as unreachable.
+        for i, addr in enumerate(pending):
+            try:
+                send_times[addr] = time.perf_counter()
+                try:
+                    sock.sendto(QUERY_PACKET, addr)
+                except BlockingIOError:
+                    if not select.select((), watched, (), timeout)[1]:
+                        raise
+                    send_times[addr] = time.perf_counter()
+                    sock.sendto(QUERY_PACKET, addr)
+            except OSError:
+                del send_times[addr]
+                for target in pending[addr]:
+                    results[target] = -1
+            if i % 64 == 63:
+                time.sleep(0.001)
+
+        # 2. Collect replies until the last query's timeout has elapsed
+        waiting = set(send_times)
+        deadline = max(send_times.values(), default=0) + timeout
+        while waiting:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not select.select(watched, (), (), remaining)[0]:
+                break
+            while True:
+                try:
+                    _, addr = sock.recvfrom_into(_PING_BUF)
+                except BlockingIOError:
+                    break
+                except OSError:
+                    # e.g. Windows reports ICMP port-unreachable as a reset; keep reading
+                    continue
+                received = time.perf_counter()
+                if addr in waiting and received - send_times[addr] <= timeout:
+                    waiting.discard(addr)
+                    latency_ms = round((received - send_times[addr]) * 1000)
+                    for target in pending[addr]:
+                        results[target] = latency_ms
+
+    # A timeout here means the server didn't respond to the official query
+    for addr in waiting:
+        for target in pending[addr]:
+            results[target] = 999
+    return results
+
+# How long a ping result is reused by later refreshes, in seconds
+PING_CACHE_TTL = 12
+
+def ping_servers_bulk(servers, timeout=0.3, cache=None):
+    """
+    Pings every server in one batch (see ping_server_batch) and stores the
+    result on its 'ping' key.
+
+    Args:
+        servers (list): Server dicts as returned by scrape_jkhub_servers.
+        timeout (float): Per-server UDP timeout in seconds.
+        cache (dict): Optional (ip, port) -> (result, time.monotonic() stamp)
+            map kept across calls; addresses pinged within PING_CACHE_TTL
+            seconds reuse their result instead of being queried again.
+    """
+    server_targets = []
+    
+    # 1. Parse each server's address
+    for server in servers:
+        addr = server.get('addr')
+        match = _ADDR_RE.fullmatch(addr) if isinstance(addr, str) else None
+
+        if match is None:
+            # A colon with a non-numeric port is a parse failure; no port at all is invalid
+            server['ping'] = 'Parse Error' if isinstance(addr, str) and ':' in addr else 'Invalid Addr'
+            continue
+
+        ip, port = match.group(1), int(match.group(2))
+        if ip and port:
+            server_targets.append((server, (ip, port)))
+        else:
+            server['ping'] = 'Invalid Addr'
+
+    # 2. Ping them all at once (minus fresh cache hits) and label the results
+    results = {}
+    to_ping = set()
+    now = time.monotonic()
+    for _, target in server_targets:
+        cached = cache.get(target) if cache is not None else None
+        if cached and now - cached[1] < PING_CACHE_TTL:
+            results[target] = cached[0]
+        else:
+            to_ping.add(target)
+    if to_ping:
+        fresh = ping_server_batch(to_ping, timeout)
+        results.update(fresh)
+        if cache is not None:
+            now = time.monotonic()
+            cache.update((target, (result, now)) for target, result in fresh.items())
+    for server, target in server_targets:
+        ping_result = results.get(target, -1)
+        
+        # Update the 'ping' key based on the result
+        if ping_result == -1:
+            server['ping'] = 'Error'
+        elif ping_result == 999:
+            server['ping'] = 'Timeout'
+        else:
+            server['ping'] = str(ping_result)
+
+# How long a scraped JKHub server list is reused before asking the site again
+JKHUB_SCRAPE_TTL = 20
+# Set MBII_DEBUG_SCRAPE=1 to log per-scrape diagnostics to stderr
+if os.environ.get('MBII_DEBUG_SCRAPE') == '1':
+    logging.basicConfig(level=logging.DEBUG)
+_jkhub_scrape_cache = None
+
+def _get_jkhub_scrape_cache():
+    """Returns the cache/jkhub_scrape.json cache, loading it on first use."""
+    global _jkhub_scrape_cache
+    if _jkhub_scrape_cache is None:
+        _jkhub_scrape_cache = HttpValidatorCache(os.path.join("cache", "jkhub_scrape.json"))
+    return _jkhub_scrape_cache
 
 def scrape_jkhub_servers(url):
     """
     Enhanced JKHub server scraper with comprehensive password detection.
     This version tries multiple methods to detect password-protected servers.
+
+    The parsed list is cached per URL for JKHUB_SCRAPE_TTL seconds, and once
+    stale the page is re-requested conditionally so a 304 skips the download
+    and the parse.
     """
+    cache = _get_jkhub_scrape_cache()
+    entry = cache.get(url)
+    if entry.get('servers') is not None and time.time() < entry.get('expires_at', 0):
+        return [dict(server) for server in entry['servers']]
+
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
+    if entry.get('servers') is not None:
+        headers.update(cache.conditional_headers(url))
 
+    # Stream the page so the table is parsed while the rest is still arriving
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, headers=headers, timeout=(5, 30), stream=True)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         print(f"Error fetching page for scraping: {e}")
         return []
 
-    try:
-        soup = BeautifulSoup(response.text, 'lxml')
-    except Exception:
-        soup = BeautifulSoup(response.text, 'html.parser')
+    with response:
+        if response.status_code == 304:
+            validators = {'ETag': entry.get('etag'), 'Last-Modified': entry.get('last_modified')}
+            cache.store(url, validators, expires_at=time.time() + JKHUB_SCRAPE_TTL, servers=entry['servers'])
+            return [dict(server) for server in entry['servers']]
 
-    server_table = soup.find('table')
-    if not server_table or not server_table.find('tbody'):
+        try:
+            servers = _parse_jkhub_servers(response.raw, response.headers.get_content_charset())
+        except (_http.HTTPException, OSError) as e:
+            print(f"Error fetching page for scraping: {e}")
+            return []
+
+    if servers:
+        cache.store(url, response.headers, expires_at=time.time() + JKHUB_SCRAPE_TTL,
+                    servers=[dict(server) for server in servers])
+    return servers
+
+# Signs that a JKHub row is password protected, searched in its markup: a
+# password image or CSS class, a lock symbol, or a lock word anywhere
+_PASSWORD_RE = re.compile(
+    r'<img\b[^>]*?password|class="[^"]*?password|🔒|🔐|🗝️|locked|private|protected',
+    re.IGNORECASE,
+)
+# Server dict field -> column index in a JKHub table row
+_JKHUB_COLS = (('hostname', 1), ('addr', 3), ('mapname', 4), ('clients', 5), ('mod', 7), ('gametype', 8))
+
+def _parse_jkhub_servers(markup, encoding=None):
+    """Parses the server table out of a JKHub page (a string or a binary stream)."""
+    # Only the server table is used, so don't build nodes for the rest of the page
+    root = parse_html(markup, only_tag='table', encoding=encoding)
+
+    server_table = root.find('.//table')
+    table_body = server_table.find('.//tbody') if server_table is not None else None
+    if table_body is None:
         print("Scraper failed: Could not find server table or table body.")
         return []
 
     servers = []
     
-    print("\n=== COMPREHENSIVE PASSWORD DETECTION DEBUG ===")
-    
-    # First, let's check if there are any password-related images anywhere on the page
-    all_images = soup.find_all('img')
-    password_images = [img for img in all_images if 
-                      (img.get('src') and 'password' in img.get('src').lower()) or
-                      (img.get('title') and 'password' in img.get('title').lower()) or
-                      (img.get('alt') and 'password' in img.get('alt').lower())]
-    
-    print(f"Found {len(password_images)} password-related images on the entire page:")
-    for img in password_images:
-        print(f"  - src: {img.get('src')}, title: {img.get('title')}, alt: {img.get('alt')}")
-    
-    # Check the raw HTML for any password.png references
-    raw_html = response.text
-    if 'password.png' in raw_html:
-        print("✓ Found 'password.png' in raw HTML")
-        # Count occurrences
-        count = raw_html.count('password.png')
-        print(f"  - Appears {count} times in the HTML")
-    else:
-        print("✗ No 'password.png' found in raw HTML")
-    
-    if 'password' in raw_html.lower():
-        print("✓ Found 'password' text somewhere in HTML")
-    
-    print("============================================\n")
-    
-    for row_idx, row in enumerate(server_table.find('tbody').find_all('tr')):
-        cells = row.find_all('td')
+    # Direct children only (XPath's tbody/tr and ./td): a name-only findall
+    # walks the children in C and never descends into cell contents
+    for row_idx, row in enumerate(table_body.findall('tr')):
+        cells = row.findall('td')
         if len(cells) < 11:
             continue
 
-        # Multiple password detection methods
-        is_passworded = False
-        detection_method = "None"
-        
-        # Method 1: Look for images with password in src, title, or alt
-        for cell_idx, cell in enumerate(cells):
-            for img in cell.find_all('img'):
-                src = img.get('src', '')
-                title = img.get('title', '')
-                alt = img.get('alt', '')
-                
-                if ('password' in src.lower() or 
-                    'password' in title.lower() or 
-                    'password' in alt.lower()):
-                    is_passworded = True
-                    detection_method = f"Image in cell {cell_idx} (src:{src}, title:{title})"
-                    break
-            if is_passworded:
-                break
-        
-        # Method 2: Check for specific lock/key symbols or text
-        if not is_passworded:
-            row_html = str(row)
-            row_text = row.get_text()
-            lock_indicators = ['🔒', '🔐', '🗝️', 'locked', 'private', 'protected']
-            
-            for indicator in lock_indicators:
-                if indicator in row_html or indicator in row_text.lower():
-                    is_passworded = True
-                    detection_method = f"Lock indicator: {indicator}"
-                    break
-        
-        # Method 3: Check for CSS classes that might indicate password protection
-        if not is_passworded:
-            for cell in cells:
-                if cell.get('class'):
-                    classes = ' '.join(cell.get('class'))
-                    if any(word in classes.lower() for word in ['password', 'locked', 'private', 'protected']):
-                        is_passworded = True
-                        detection_method = f"CSS class: {classes}"
-                        break
-
-        # Extract server data
+        # Password detection is one C-level scan over the row's markup
+        is_passworded = _PASSWORD_RE.search(_ET.tostring(row, encoding='unicode', method='html')) is not None
+
+        # Extract server data (only the mapped cells are read; .text is already stripped)
         try:
-            server_data = {
-                'hostname': cells[1].text.strip(),
-                'addr': cells[3].text.strip(),
-                'mapname': cells[4].text.strip(),
-                'clients': cells[5].text.strip(),
-                'mod': cells[7].text.strip(),
-                'gametype': cells[8].text.strip(),
-                'ping': 'Pinging...',
-                'passworded': is_passworded
-            }
-            
-            # Debug output for passworded servers
-            if is_passworded:
-                print(f"🔒 PASSWORDED SERVER FOUND:")
-                print(f"   Server: {server_data['hostname']}")
-                print(f"   Address: {server_data['addr']}")
-                print(f"   Detection method: {detection_method}")
-                print(f"   Row HTML snippet: {str(row)[:200]}...\n")
+            server_data = {field: _element_text(cells[index]) for field, index in _JKHUB_COLS}
+            server_data['ping'] = 'Pinging...'
+            server_data['passworded'] = is_passworded
             
             servers.append(server_data)
             
@@ -458,11 +1265,96 @@ def scrape_jkhub_servers(url):
             print(f"Error parsing row {row_idx}: {e}")
             continue
     
-    passworded_count = sum(1 for server in servers if server['passworded'])
-    print(f"Scraper found {len(servers)} servers total, {passworded_count} password-protected")
+    if logger.isEnabledFor(logging.DEBUG):
+        passworded_count = sum(1 for server in servers if server['passworded'])
+        logger.debug("Scraper found %d servers total, %d password-protected", len(servers), passworded_count)
     
     return servers
 
+# --- Unified dark theme palette ---
+DARK_BACKGROUND_COLOR = "#121212"  # A very dark background for consistency
+DARK_WIDGET_COLOR = "#1e1e1e"      # A slightly lighter dark color for widgets
+TEXT_COLOR = "white"
+HIGHLIGHT_COLOR = "#4a4a4a"        # A subtle highlight color for selections
+BORDER_COLOR = "#333333"           # A darker gray for borders
+
+# Settings for the "CustomDark" ttk theme, built once at import
+_THEME_SETTINGS = {
+    "TCombobox": {
+        "configure": {
+            "selectbackground": HIGHLIGHT_COLOR,
+            "fieldbackground": DARK_WIDGET_COLOR,
+            "background": DARK_WIDGET_COLOR,
+            "foreground": TEXT_COLOR,
+            "bordercolor": BORDER_COLOR,
+            "arrowcolor": TEXT_COLOR,
+            "padding": 3,
+        },
+        "map": {
+            "fieldbackground": [("readonly", DARK_WIDGET_COLOR)],
+            "selectbackground": [("readonly", DARK_WIDGET_COLOR)],
+            "selectforeground": [("readonly", TEXT_COLOR)],
+        }
+    },
+    "TCombobox.listbox": {
+        "configure": {
+            "background": DARK_WIDGET_COLOR,
+            "foreground": TEXT_COLOR,
+            "selectbackground": HIGHLIGHT_COLOR,
+            "selectforeground": TEXT_COLOR,
+            "bordercolor": BORDER_COLOR,
+            "relief": "flat",
+        }
+    },
+    "TLabel": {
+        "configure": {
+            "background": DARK_BACKGROUND_COLOR,
+            "foreground": TEXT_COLOR,
+        }
+    },
+    "TFrame": {
+        "configure": {
+            "background": DARK_BACKGROUND_COLOR,
+        }
+    },
+    # A new style for the download path entry with a light background and dark text
+    "DownloadPath.TEntry": {
+        "configure": {
+            "fieldbackground": "#f0f0f0",  # Light gray background
+            "foreground": "black",         # Black text
+            "bordercolor": BORDER_COLOR,
+        },
+        "map": {
+            "fieldbackground": [("readonly", "#f0f0f0")],
+        }
+    },
+    "TButton": {
+        "configure": {
+            "background": BORDER_COLOR,
+            "foreground": TEXT_COLOR,
+            "bordercolor": BORDER_COLOR,
+            "relief": "flat",
+        },
+        "map": {
+            "background": [("active", HIGHLIGHT_COLOR)],
+        }
+    },
+    "TProgressbar": {
+        "configure": {
+            "background": "#3498db",
+            "troughcolor": DARK_WIDGET_COLOR,
+            "bordercolor": BORDER_COLOR,
+        }
+    },
+    "TScrollbar": {
+        "configure": {
+            "background": BORDER_COLOR,
+            "troughcolor": DARK_WIDGET_COLOR,
+            "bordercolor": BORDER_COLOR,
+        }
+    },
+}
+
 class GitHubReleaseManager:
     """
     A Tkinter application to download a specific release from a GitHub repository.
@@ -476,6 +1368,9 @@ class GitHubReleaseManager:
     HARDCODED_REPOSITORIES_REPO_URL = "https://raw.githubusercontent.com/MBII-Galactic-Conquest/mbii-community-updater/main/repositories.json"
     HARDCODED_SERVERS_URL = "https://raw.githubusercontent.com/MBII-Galactic-Conquest/mbii-community-updater/main/servers.json"
 
+    # PhotoImages keyed by (path, size), shared by every window of the app
+    _photo_cache = {}
+
     def __init__(self, master):
         """
         Initializes the application window and widgets.
@@ -492,8 +1387,16 @@ class GitHubReleaseManager:
         
         # --- Application State Variables ---
         self.repositories = []
+        self.repo_display_names = []
+        # Latest-tag colour refresh state (Tk thread only)
+        self.color_refresh_running = False
+        self.color_refresh_pending = False
+        # Names and foreground colours currently shown in the repository Listbox
+        self.listed_repo_names = ()
+        self.row_fg = []
         self.servers_config = {}
         self.client_data = {}
+        self.last_tags = {}
         self.current_repo_data = {}
         self.available_releases = {}
         self.download_path = None
@@ -502,6 +1405,7 @@ class GitHubReleaseManager:
         self.current_owner = ""
         self.current_repo = ""
         self.is_rate_limited = False # Flag to prevent multiple rate limit popups and actions
+        self.client_save_job = None  # Pending after() id of a debounced client.json save
         
         # This instance variable is crucial for preventing the background image
         # from being garbage collected by Python.
@@ -509,11 +1413,11 @@ class GitHubReleaseManager:
         self.icon_path_ico = None # New instance variable to store the icon path
 
         # --- Define Colors for a Unified Theme ---
-        self.dark_background_color = "#121212"  # A very dark background for consistency
-        self.dark_widget_color = "#1e1e1e"     # A slightly lighter dark color for widgets
-        self.text_color = "white"
-        self.highlight_color = "#4a4a4a"       # A subtle highlight color for selections
-        self.border_color = "#333333"          # A darker gray for borders
+        self.dark_background_color = DARK_BACKGROUND_COLOR
+        self.dark_widget_color = DARK_WIDGET_COLOR
+        self.text_color = TEXT_COLOR
+        self.highlight_color = HIGHLIGHT_COLOR
+        self.border_color = BORDER_COLOR
 
         # --- File Paths are now relative to a 'cache' directory ---
         self.create_cache_directory()
@@ -521,30 +1425,32 @@ class GitHubReleaseManager:
         self.servers_file = os.path.join("cache", "servers.json")
         self.client_file = os.path.join("cache", "client.json")
         self.mbii_directory_file = os.path.join("cache", "mbiidirectory.json")
+        # ETag / Last-Modified validators for conditional downloads
+        self.http_cache = HttpValidatorCache(os.path.join("cache", "http_cache.json"))
+        # Trimmed release/asset lists keyed by releases API URL, revalidated by ETag
+        self.release_cache = HttpValidatorCache(os.path.join("cache", "release_cache.json"))
         # Music file is now expected in the root directory, not the cache
         self.music_file = get_resource_path("music.mp3")
         
         # UI for loading screen
         self.loading_window = None
-        self.loading_animation = None
-        self.spinner = itertools.cycle(['|', '/', '-', '\\'])
+        self.loading_progress = None
         
         # String variable for the download path display
         self.download_path_var = tk.StringVar(self.master, value="Not Set")
         # String variable for the repository description
         self.description_var = tk.StringVar(self.master, value="Select a repository to see its description.")
         
-        # Music player state
+        # Music player state (the mixer itself is only initialized on first playback)
         self.is_music_playing = False
+        self.music_volume = 0.16
 
-        # Initialize the pygame mixer
-        mixer.init()
-        
         self.create_widgets()
         
         # --- NEW STARTUP LOGIC: Fetch repositories first, then populate the UI ---
         self.status_label.config(text="Fetching latest repository list...", fg="#3498db")
-        threading.Thread(target=self.fetch_and_populate_repositories, daemon=True).start()
+        submit_background(self.fetch_and_populate_repositories)
+        submit_background(self.fetch_modded_servers_list)
 
         self.load_mbii_directory()
         self.load_client_data()
@@ -553,6 +1459,24 @@ class GitHubReleaseManager:
         
         # Bind the close event to a handler
         self.master.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Popups are centred on the main window; re-measure it only after it moves
+        self.master_center_cache = None
+        self.master.bind("<Configure>", self.invalidate_master_center, add="+")
+
+    def invalidate_master_center(self, event):
+        """Drops the cached window centre when the main window is moved or resized."""
+        # Child widgets' <Configure> events also reach the root's bindings
+        if event.widget is self.master:
+            self.master_center_cache = None
+
+    def master_center(self):
+        """Returns the (x, y) screen position of the main window's centre."""
+        if self.master_center_cache is None:
+            self.master_center_cache = (
+                self.master.winfo_x() + self.master.winfo_width() // 2,
+                self.master.winfo_y() + self.master.winfo_height() // 2,
+            )
+        return self.master_center_cache
 
     def get_matching_repository(self, server_hostname):
         """
@@ -571,7 +1495,6 @@ class GitHubReleaseManager:
         # The 'servers.json' file maps strict hostname -> custom_name.
         if normalized_hostname in self.servers_config:
             content_name = self.servers_config[normalized_hostname]
-            print(f"Server matched via strict servers.json lookup: {content_name}")
             return next((repo for repo in self.repositories if repo.get('custom_name').lower() == content_name.lower()), None)
 
         # 2. Perform the flexible, substring-based search (The user's requested logic)
@@ -587,7 +1510,6 @@ class GitHubReleaseManager:
 
             # Flexible Match: Check if server name contains the content's custom_name
             if normalized_custom_name in normalized_hostname:
-                print(f"Server matched via flexible custom_name lookup: {custom_name}")
                 return repo
 
         return None # No associated content found (joins directly, as per requirement)
@@ -603,35 +1525,35 @@ class GitHubReleaseManager:
             tuple: (status_string, latest_tag_name)
         """
         repo_url = repo.get('url')
-        local_tag = self.client_data.get(repo_url, {}).get('last_tag')
+        local_tag = self.last_tags.get(repo_url)
 
         if not local_tag:
             return 'not_downloaded', None
 
         try:
-            parts = repo_url.rstrip('/').split('/')
-            owner = parts[-2]
-            repo_name = parts[-1]
-            api_url = f"https://api.github.com/repos/{owner}/{repo_name}/releases/latest"
-
             # Use a short timeout for responsiveness
-            response = requests.get(api_url, timeout=5)
-            response.raise_for_status()
-            latest_tag = response.json().get('tag_name')
-
-            if not latest_tag:
-                return 'up-to-date', local_tag # Cannot determine remote, assume safe
-
-            if local_tag == latest_tag:
-                return 'up-to-date', latest_tag
-            else:
-                return 'outdated', latest_tag
+            latest_tag = self.latest_release_tag(repo_url, timeout=5)
+            return compare_release_tags(local_tag, latest_tag)
 
         except requests.exceptions.RequestException as e:
             print(f"Warning: Failed to get latest release for {repo_url}. Assuming up-to-date. Error: {e}")
             # On failure, assume up-to-date to allow joining the server.
             return 'up-to-date', local_tag
 
+    def get_content_statuses(self, repo_urls):
+        """
+        Batch form of get_content_status for the server list: returns
+        {repo_url: (status_string, latest_tag_name)}, looking up each distinct
+        repository's latest release once through fetch_latest_tags_batch.
+        """
+        local_tags = {repo_url: self.last_tags.get(repo_url) for repo_url in repo_urls}
+        installed = [repo_url for repo_url, local_tag in local_tags.items() if local_tag]
+        latest_tags = self.fetch_latest_tags_batch(installed) if installed else {}
+        return {
+            repo_url: compare_release_tags(local_tag, latest_tags.get(repo_url)) if local_tag else ('not_downloaded', None)
+            for repo_url, local_tag in local_tags.items()
+        }
+
     def load_servers_config(self):
         """
         Loads the server content mapping from cache/servers.json.
@@ -665,32 +1587,23 @@ class GitHubReleaseManager:
         else:
             try:
                 icon_path_png = get_resource_path("icon.png")
-                icon_image = Image.open(icon_path_png)
-                icon_photo = ImageTk.PhotoImage(icon_image)
+                icon_photo = self.load_photo(icon_path_png)
                 self.master.iconphoto(True, icon_photo)
             except (tk.TclError, FileNotFoundError, IOError):
                 print("WARNING: Neither 'icon.ico' nor 'icon.png' found. Skipping window icon.")
 
-        # Create a Canvas that fills the entire master window
-        canvas = tk.Canvas(self.master, highlightthickness=0)
+        # Create a Canvas that fills the entire master window.
+        # The dark fill shows until the background image has been decoded.
+        canvas = tk.Canvas(self.master, highlightthickness=0, bg=self.dark_background_color)
         canvas.pack(fill="both", expand=True)
 
         window_width = 502
         window_height = 351
         
-        try:
-            image_path = get_resource_path("background.png")
-            pil_image = Image.open(image_path)
-            resized_image = pil_image.resize((window_width, window_height), Image.LANCZOS)
-            self.bg_image_ref = ImageTk.PhotoImage(resized_image)
-            canvas.create_image(0, 0, image=self.bg_image_ref, anchor="nw")
-            
-            # Create a semi-transparent dark overlay on the canvas
-            # This is the key to letting the background image show through while maintaining a dark theme.
-            canvas.create_rectangle(0, 0, window_width, window_height, fill=self.dark_background_color, stipple='gray50')
-            
-        except (tk.TclError, FileNotFoundError, IOError):
-            print("WARNING: 'background.png' not found or is invalid. Falling back to a solid dark background.")
+        # Decode and resize the background on the pool; PhotoImage is built on the Tk thread
+        image_path = get_resource_path("background.png")
+        future = DOWNLOAD_POOL.submit(load_resized_image, image_path, (window_width, window_height))
+        future.add_done_callback(lambda f: self.master.after(0, lambda: self.apply_background_image(canvas, f, image_path, (window_width, window_height))))
 
         # Use a new frame to hold all the content, and place it *on* the canvas
         content_frame = tk.Frame(canvas, bg=self.dark_background_color)
@@ -700,74 +1613,8 @@ class GitHubReleaseManager:
 
         # --- Configure a custom ttk style for widgets ---
         style = ttk.Style()
-        style.theme_create("CustomDark", parent="alt", settings={
-            "TCombobox": {
-                "configure": {
-                    "selectbackground": self.highlight_color,
-                    "fieldbackground": self.dark_widget_color,
-                    "background": self.dark_widget_color,
-                    "foreground": self.text_color,
-                    "bordercolor": self.border_color,
-                    "arrowcolor": self.text_color,
-                    "padding": 3,
-                },
-                "map": {
-                    "fieldbackground": [("readonly", self.dark_widget_color)],
-                    "selectbackground": [("readonly", self.dark_widget_color)],
-                    "selectforeground": [("readonly", self.text_color)],
-                }
-            },
-            "TCombobox.listbox": {
-                "configure": {
-                    "background": self.dark_widget_color,
-                    "foreground": self.text_color,
-                    "selectbackground": self.highlight_color,
-                    "selectforeground": self.text_color,
-                    "bordercolor": self.border_color,
-                    "relief": "flat",
-                }
-            },
-            "TLabel": {
-                "configure": {
-                    "background": self.dark_background_color,
-                    "foreground": self.text_color,
-                }
-            },
-            "TFrame": {
-                "configure": {
-                    "background": self.dark_background_color,
-                }
-            },
-            # A new style for the download path entry with a light background and dark text
-            "DownloadPath.TEntry": {
-                "configure": {
-                    "fieldbackground": "#f0f0f0",  # Light gray background
-                    "foreground": "black",         # Black text
-                    "bordercolor": self.border_color,
-                },
-                "map": {
-                    "fieldbackground": [("readonly", "#f0f0f0")],
-                }
-            },
-            "TButton": {
-                "configure": {
-                    "background": self.border_color,
-                    "foreground": self.text_color,
-                    "bordercolor": self.border_color,
-                    "relief": "flat",
-                },
-                "map": {
-                    "background": [("active", self.highlight_color)],
-                }
-            },
-            "TScrollbar": {
-                "configure": {
-                    "background": self.border_color,
-                    "troughcolor": self.dark_widget_color,
-                    "bordercolor": self.border_color,
-                }
-            },
-        })
+        if "CustomDark" not in style.theme_names():
+            style.theme_create("CustomDark", parent="alt", settings=_THEME_SETTINGS)
         style.theme_use("CustomDark")
 
         # --- NEW: Top Button Row for App Sections ---
@@ -856,11 +1703,42 @@ class GitHubReleaseManager:
         self.music_button.bind("<Enter>", lambda e: e.widget.configure(bg="#2980b9"))
         self.music_button.bind("<Leave>", lambda e: e.widget.configure(bg="#3498db"))
 
+    def load_photo(self, path, size=None):
+        """
+        Returns a PhotoImage for path (resized to size if given), building it
+        only once. Must be called on the Tk thread.
+        """
+        key = (path, size)
+        photo = self._photo_cache.get(key)
+        if photo is None:
+            photo = self._photo_cache[key] = ImageTk.PhotoImage(load_resized_image(path, size))
+        return photo
+
+    def apply_background_image(self, canvas, future, image_path, size):
+        """Draws the decoded background image and its dark overlay onto the main canvas."""
+        try:
+            # The worker has already decoded and cached the image; this just surfaces its errors
+            future.result()
+            self.bg_image_ref = self.load_photo(image_path, size)
+        except (tk.TclError, FileNotFoundError, IOError):
+            print("WARNING: 'background.png' not found or is invalid. Falling back to a solid dark background.")
+            return
+
+        canvas.create_image(0, 0, image=self.bg_image_ref, anchor="nw")
+
+        # Create a semi-transparent dark overlay on the canvas
+        # This is the key to letting the background image show through while maintaining a dark theme.
+        canvas.create_rectangle(0, 0, self.bg_image_ref.width(), self.bg_image_ref.height(), fill=self.dark_background_color, stipple='gray50')
+
     def on_close(self):
         """Handler for the window close event."""
         _MciMixer._stop.set()
         _MciMixer._cmd('close bgm')
+        # os._exit below skips any debounced save still waiting
+        self.flush_client_data()
         self.master.destroy()
+        # os._exit skips interpreter cleanup, so end pooled TLS sessions explicitly
+        SESSION.close()
         os._exit(0)
 
     def handle_rate_limit(self):
@@ -883,100 +1761,169 @@ class GitHubReleaseManager:
         If that fails, it falls back to a local file in the cache directory.
         The UI is then populated on the main thread.
         """
+        popup = None  # (title, message) for a warning shown alongside the status
         try:
             url = self.HARDCODED_REPOSITORIES_REPO_URL
-            response = requests.get(url)
+            # Revalidate against the saved copy so an unchanged list costs a bodyless 304
+            cached_repositories = read_json_file(self.repositories_file)
+            headers = self.http_cache.conditional_headers(url) if cached_repositories is not None else {}
+            response = SESSION.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
-            self.repositories = response.json()
-            
-            # Save the newly fetched list for local fallback
-            try:
-                with open(self.repositories_file, 'w') as f:
-                    json.dump(self.repositories, f, indent=4)
-            except IOError as e:
-                self.master.after(0, lambda: self.show_custom_messagebox("File Save Error", f"Could not save the new repository list: {e}", icon_type='warning'))
+            if response.status_code == 304:
+                self.set_repositories(cached_repositories)
+            else:
+                digest = hashlib.sha256(response.content).hexdigest()
+                if cached_repositories is not None and digest == self.http_cache.get(url).get('sha256'):
+                    # Byte-identical to the saved copy (the server ignored the validators)
+                    self.set_repositories(cached_repositories)
+                else:
+                    self.set_repositories(response.json())
+                    
+                    # Save the newly fetched list for local fallback
+                    try:
+                        write_file_atomic(self.repositories_file, _json_dumps(self.repositories))
+                        self.http_cache.store(url, response.headers, sha256=digest)
+                    except IOError as e:
+                        popup = ("File Save Error", f"Could not save the new repository list: {e}")
             
-            self.master.after(0, lambda: self.status_label.config(text="Loaded repository list from remote URL.", fg="#4CAF50"))
-            self.master.after(0, self.populate_repositories)
+            status = ("Loaded repository list from remote URL.", "#4CAF50")
 
         except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
             # Fallback to local file if the remote fetch fails
             if os.path.exists(self.repositories_file):
                 try:
-                    with open(self.repositories_file, 'r') as f:
-                        self.repositories = json.load(f)
-                    self.master.after(0, lambda: self.status_label.config(text="Could not fetch remote list. Loaded local fallback.", fg="orange"))
+                    with open(self.repositories_file, 'rb') as f:
+                        self.set_repositories(_json_loads(f.read()))
+                    status = ("Could not fetch remote list. Loaded local fallback.", "orange")
                 except (IOError, json.JSONDecodeError):
-                    self.repositories = []
-                    self.master.after(0, lambda: self.status_label.config(text="Failed to load local repositories file. Please check your network.", fg="#e74c3c"))
+                    self.set_repositories([])
+                    status = ("Failed to load local repositories file. Please check your network.", "#e74c3c")
             else:
-                self.repositories = []
-                self.master.after(0, lambda: self.status_label.config(text="No remote or local repository list found. Please check network.", fg="#e74c3c"))
-                self.master.after(0, lambda msg=str(e): self.show_custom_messagebox("Repository List Warning", f"Could not fetch or find repositories.json.\nError: {msg}", icon_type='warning'))
+                self.set_repositories([])
+                status = ("No remote or local repository list found. Please check network.", "#e74c3c")
+                popup = ("Repository List Warning", f"Could not fetch or find repositories.json.\nError: {e}")
+
+        # One Tk callback applies every UI change for this fetch
+        self.master.after(0, self.apply_repository_results, status, popup)
 
+    def fetch_modded_servers_list(self):
+        """
+        Refreshes the saved servers.json from the hardcoded URL. Runs on the
+        worker pool alongside fetch_and_populate_repositories: the two are
+        independent, so neither waits for the other's round trip.
+        """
         try:
             url2 = self.HARDCODED_SERVERS_URL
-            response2 = requests.get(url2)
+            # Revalidate the saved copy: an unchanged list is a bodyless 304
+            headers2 = self.http_cache.conditional_headers(url2) if os.path.exists(self.servers_file) else {}
+            # Same host as the repository list; requests in flight together
+            # each get their own pooled connection
+            response2 = SESSION.get(url2, headers=headers2, timeout=10)
             response2.raise_for_status()
+            if response2.status_code == 304:
+                return
 
             servers_data = response2.json() 
 
             try:
-                with open(self.servers_file, 'w') as f:
-                    json.dump(servers_data, f, indent=4)
+                write_file_atomic(self.servers_file, _json_dumps(servers_data))
+                self.http_cache.store(url2, response2.headers)
 
-                self.master.after(0, lambda: print("Servers list saved successfully.")) 
+                print("Servers list saved successfully.")
 
             except IOError as e:
-                self.master.after(0, lambda: self.show_custom_messagebox("Servers File Save Error", f"Could not save the new modded servers list: {e}", icon_type='warning'))
+                self.master.after(0, lambda msg=str(e): self.show_custom_messagebox("Servers File Save Error", f"Could not save the new modded servers list: {msg}", icon_type='warning'))
 
         except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
-            self.master.after(0, lambda: print(f"Warning: Failed to fetch modded servers list from URL: {e}"))
-            self.master.after(0, self.populate_repositories)
+            print(f"Warning: Failed to fetch modded servers list from URL: {e}")
+
+    def apply_repository_results(self, status, popup):
+        """Applies the outcome of fetch_and_populate_repositories on the Tk thread."""
+        status_text, status_fg = status
+        self.status_label.config(text=status_text, fg=status_fg)
+        self.populate_repositories()
+        if popup:
+            self.show_custom_messagebox(*popup, icon_type='warning')
+
+    def set_repositories(self, repositories):
+        """Stores the repository list and derives each entry's display name once."""
+        self.repositories = repositories
+        self.repo_display_names = [
+            repo.get('custom_name') or repo['url'].rstrip('/').split('/')[-1]
+            for repo in repositories
+        ]
 
     def load_client_data(self):
         """Loads the local client data (download history and music settings) from `client.json`."""
         if os.path.exists(self.client_file):
             try:
-                with open(self.client_file, 'r') as f:
-                    self.client_data = json.load(f)
+                with open(self.client_file, 'rb') as f:
+                    self.client_data = _json_loads(f.read())
             except (IOError, json.JSONDecodeError):
                 self.client_data = {}
         else:
             self.client_data = {}
+        self.refresh_last_tags()
+        # The environment wins over a token saved in client.json
+        set_github_token(os.environ.get('GITHUB_TOKEN') or self.client_data.get('github_token'))
+
+    def refresh_last_tags(self):
+        """Rebuilds the repo url -> installed tag lookup from client_data."""
+        self.last_tags = {
+            url: entry.get('last_tag')
+            for url, entry in self.client_data.items()
+            if isinstance(entry, dict) and entry.get('last_tag')
+        }
 
     def save_client_data(self):
         """Saves the current client data (download history and music settings) to `client.json`."""
+        self.refresh_last_tags()
         try:
-            with open(self.client_file, 'w') as f:
-                json.dump(self.client_data, f, indent=4)
+            write_file_atomic(self.client_file, _json_dumps(self.client_data))
         except IOError as e:
             self.show_custom_messagebox("Error", f"Could not save client data to file: {e}", icon_type='error')
 
     def save_music_settings(self):
-        """Saves the current music settings to client_data and then to the file."""
+        """Saves the current music settings to client_data, then schedules a file save."""
         music_settings = self.client_data.get("music_settings", {})
         music_settings["auto_play"] = self.is_music_playing
-        music_settings["volume"] = mixer.music.get_volume() if mixer.get_init() else 0.16
+        music_settings["volume"] = mixer.music.get_volume() if mixer.get_init() else self.music_volume
         self.client_data["music_settings"] = music_settings
-        self.save_client_data()
+        self.schedule_client_save()
+
+    def schedule_client_save(self):
+        """
+        Saves client_data CLIENT_SAVE_DELAY_MS after the last call, so rapid
+        toggles cost one write. Tk thread only.
+        """
+        if self.client_save_job is not None:
+            self.master.after_cancel(self.client_save_job)
+        self.client_save_job = self.master.after(CLIENT_SAVE_DELAY_MS, self.flush_client_data)
+
+    def flush_client_data(self):
+        """Runs a pending debounced save now (see schedule_client_save)."""
+        if self.client_save_job is not None:
+            self.master.after_cancel(self.client_save_job)
+            self.client_save_job = None
+            self.save_client_data()
             
     def load_sound_settings(self):
         """Loads sound settings from `client.json` or uses defaults."""
         music_settings = self.client_data.get("music_settings", {})
         auto_play = music_settings.get("auto_play", True)
-        volume = music_settings.get("volume", 0.16)
+        self.music_volume = max(0, min(1, music_settings.get("volume", 0.16)))
         
-        if mixer.get_init():
-            mixer.music.set_volume(max(0, min(1, volume)))
-            if auto_play and os.path.exists(self.music_file):
-                self.play_music()
+        if auto_play and os.path.exists(self.music_file):
+            self.play_music()
 
     def play_music(self):
         """Plays the music.mp3 file if it exists."""
         if os.path.exists(self.music_file):
             try:
+                if not mixer.get_init():
+                    mixer.init()
+                    mixer.music.set_volume(self.music_volume)
                 mixer.music.load(self.music_file)
                 mixer.music.play(-1)
                 self.is_music_playing = True
@@ -998,7 +1945,7 @@ class GitHubReleaseManager:
             self.is_music_playing = False
             self.music_button.config(text="Music Off")
         else:
-            if mixer.music.get_busy():
+            if mixer.get_init() and mixer.music.get_busy():
                 mixer.music.unpause()
             else:
                 self.play_music()
@@ -1013,32 +1960,23 @@ class GitHubReleaseManager:
         """
         if os.path.exists(self.mbii_directory_file):
             try:
-                with open(self.mbii_directory_file, 'r') as f:
-                    data = json.load(f)
-                    path = data.get("path")
-                    if path and os.path.isdir(path):
-                        self.download_path = path
-                        self.download_path_var.set(path)
+                with open(self.mbii_directory_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                    if self.set_download_path(data.get("path")):
                         self.status_label.config(text=f"Loaded saved MBII directory.", fg="#3498db")
                     else:
                         self.status_label.config(text="Saved MBII directory not found. Please select a new one.", fg="orange")
-                        self.download_path = None
-                        self.download_path_var.set("Not Set")
             except (IOError, json.JSONDecodeError):
-                self.download_path = None
-                self.download_path_var.set("Not Set")
-                pass
+                self.set_download_path(None)
         else:
-            self.download_path = None
-            self.download_path_var.set("Not Set")
+            self.set_download_path(None)
         
         self.update_download_button_state()
 
     def save_mbii_directory(self, path):
         """Saves the MBII directory path to a JSON file."""
         try:
-            with open(self.mbii_directory_file, 'w') as f:
-                json.dump({"path": path}, f, indent=4)
+            write_file_atomic(self.mbii_directory_file, _json_dumps({"path": path}))
         except IOError as e:
             self.show_custom_messagebox("Error", f"Could not save MBII directory to file: {e}", icon_type='error')
 
@@ -1051,58 +1989,160 @@ class GitHubReleaseManager:
         - Orange: processing (until checked)
         - White: untouched / unknown
         """
-        self.listbox_repos.delete(0, tk.END)
+        names = tuple(self.repo_display_names)
+        if names != self.listed_repo_names:
+            self.listbox_repos.delete(0, tk.END)
+            # Insert every row in a single Tcl call, then colour them
+            self.listbox_repos.insert(tk.END, *names)
+            self.listed_repo_names = names
+            # Fresh rows use the Listbox's white foreground
+            self.row_fg = [self.text_color] * len(names)
+
+        # last_tags is the url -> installed tag snapshot kept by refresh_last_tags
+        last_tags = self.last_tags
+        pending = []  # (index, repo url, installed tag)
         for i, repo in enumerate(self.repositories):
-            repo_name_display = repo.get('custom_name') or repo['url'].rstrip('/').split('/')[-1]
-            self.listbox_repos.insert(tk.END, repo_name_display)
-
             url = repo.get('url')
-            last_tag = self.client_data.get(url, {}).get('last_tag')
-
-            # Default to white
-            color = "white"
+            last_tag = last_tags.get(url)
 
             if last_tag:
-                # Temporarily mark as processing (orange)
-                color = "orange"
-                self.listbox_repos.itemconfig(i, {'fg': color})
-
-                def update_color(index, repo_url, tag):
-                    try:
-                        parts = repo_url.rstrip('/').split('/')
-                        owner = parts[-2]
-                        repo_name = parts[-1]
-                        api_url = f"https://api.github.com/repos/{owner}/{repo_name}/releases/latest"
-                        response = requests.get(api_url)
-                        response.raise_for_status()
-                        latest = response.json().get('tag_name')
-                        new_color = "green" if latest == tag else "red"
-                    except:
-                        new_color = "white"
-
-                    self.master.after(0, lambda: self.listbox_repos.itemconfig(index, {'fg': new_color}))
-
-                # Launch the check in a thread to avoid freezing the GUI
-                threading.Thread(target=update_color, args=(i, url, last_tag), daemon=True).start()
+                # Orange while the latest-tag lookup is processing
+                self.set_row_fg(i, "orange")
+                pending.append((i, url, last_tag))
             else:
-                self.listbox_repos.itemconfig(i, {'fg': color})
+                self.set_row_fg(i, self.text_color)
+
+        if self.color_refresh_running:
+            # A lookup is already in flight and its row indices may now be
+            # stale; re-run once when it lands instead of applying it
+            self.color_refresh_pending = True
+        elif pending:
+            # One background lookup for every installed repo, off the GUI thread
+            self.color_refresh_running = True
+            submit_background(self.update_repository_colors, pending)
 
         self.reset_ui()
 
+    def update_repository_colors(self, pending):
+        """
+        Worker: looks up the latest tag of every installed repository in one
+        batch, then recolours all of their rows in a single Tk callback.
+        """
+        colors = []
+        try:
+            latest_tags = self.fetch_latest_tags_batch([url for _, url, _ in pending])
+            for index, url, tag in pending:
+                latest = latest_tags.get(url)
+                colors.append((index, "white" if latest is None else "green" if latest == tag else "red"))
+        finally:
+            self.master.after(0, self.apply_repository_colors, colors)
+
+    def apply_repository_colors(self, colors):
+        """Applies a finished colour lookup, or coalesces queued refreshes into one re-run."""
+        self.color_refresh_running = False
+        if self.color_refresh_pending:
+            # The list was repainted while this batch was in flight, so its rows are stale
+            self.color_refresh_pending = False
+            self.populate_repositories()
+            return
+        for index, color in colors:
+            self.set_row_fg(index, color)
+
+    def set_row_fg(self, index, color):
+        """Recolours one repository row, skipping the Tk call when it already has that colour."""
+        if self.row_fg[index] != color:
+            self.row_fg[index] = color
+            self.listbox_repos.itemconfig(index, {'fg': color})
+
+    def fetch_latest_tags_batch(self, repo_urls):
+        """
+        Returns {repo_url: latest release tag, or None if it can't be determined}.
+        With a GITHUB_TOKEN, a single GraphQL query covers every repository for
+        one rate-limit point; otherwise each repo's REST endpoint is queried
+        concurrently.
+        """
+        repo_urls = list(dict.fromkeys(repo_urls))
+        if GITHUB_TOKEN:
+            try:
+                return self._fetch_latest_tags_graphql(repo_urls)
+            except (requests.exceptions.RequestException, ValueError, TypeError, AttributeError, IndexError) as e:
+                print(f"GraphQL latest-tag lookup failed, falling back to REST: {e}")
+        return dict(zip(repo_urls, GITHUB_API_POOL.map(self._fetch_latest_tag, repo_urls)))
+
+    def _fetch_latest_tags_graphql(self, repo_urls):
+        """Fetches every repository's latest release tag with one aliased GraphQL query."""
+        fields = []
+        for i, repo_url in enumerate(repo_urls):
+            owner, repo_name = split_repo_url(repo_url)
+            fields.append(f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo_name)}) {{ latestRelease {{ tagName }} }}')
+        response = SESSION.post(
+            GITHUB_GRAPHQL_URL,
+            json={'query': 'query { ' + ' '.join(fields) + ' }'},
+            headers={'Authorization': f'bearer {GITHUB_TOKEN}'},
+            timeout=(5, 30),
+        )
+        # Unknown repositories come back as null entries next to an 'errors' list
+        data = response.json().get('data') or {}
+        return {
+            repo_url: ((data.get(f'r{i}') or {}).get('latestRelease') or {}).get('tagName')
+            for i, repo_url in enumerate(repo_urls)
+        }
+
+    def _fetch_latest_tag(self, repo_url):
+        """Fetches one repository's latest release tag over REST, or None on failure."""
+        try:
+            return self.latest_release_tag(repo_url)
+        except (requests.exceptions.RequestException, ValueError, AttributeError, IndexError):
+            return None
+
+    def latest_release_tag(self, repo_url, timeout=(5, 60)):
+        """
+        Returns the tag of a repository's latest release. The request carries
+        the ETag from the previous answer, and GitHub's bodyless 304 reply
+        (which doesn't count against the rate limit) reuses the stored tag.
+        Raises requests.exceptions.RequestException on failure.
+        """
+        owner, repo_name = split_repo_url(repo_url)
+        api_url = f"https://api.github.com/repos/{owner}/{repo_name}/releases/latest"
+        cached = self.http_cache.get(api_url)
+        headers = dict(GITHUB_API_HEADERS)
+        if 'tag_name' in cached:
+            headers.update(self.http_cache.conditional_headers(api_url))
+
+        response = SESSION.get(api_url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        if response.status_code == 304:
+            return cached['tag_name']
+        tag_name = response.json().get('tag_name')
+        self.http_cache.store(api_url, response.headers, tag_name=tag_name)
+        return tag_name
+
     def select_download_path(self):
         """Opens a file dialog for the user to select a download directory and validates it."""
         path = filedialog.askdirectory()
         if path:
-            if 'mbii' in path.lower() or 'supremacy' in path.lower():
-                self.download_path = path
-                self.download_path_var.set(path)
+            if self.set_download_path(path):
                 self.save_mbii_directory(path)
             else:
                 self.show_custom_messagebox("Invalid Directory", "The selected directory must contain 'MBII' or 'SUPREMACY' in its name.", icon_type='error')
-                self.download_path = None
-                self.download_path_var.set("Not Set")
         self.update_download_button_state()
 
+    def set_download_path(self, path):
+        """
+        Validates path and stores it as the MBII folder, so the button state
+        checks only test self.download_path for None; on_download validates it
+        again before installing. Invalid paths clear it.
+        Returns True if the path was accepted.
+        """
+        lowered = path.lower() if path else ""
+        if any(k in lowered for k in ('mbii', 'supremacy')) and os.path.isdir(path):
+            self.download_path = path
+            self.download_path_var.set(path)
+            return True
+        self.download_path = None
+        self.download_path_var.set("Not Set")
+        return False
+
     def on_listbox_select(self, event):
         """
         Handles a repository selection, fetching its releases in a new thread.
@@ -1132,9 +2172,7 @@ class GitHubReleaseManager:
 
         if self.selected_repo_url:
             try:
-                parts = self.selected_repo_url.rstrip('/').split('/')
-                self.current_owner = parts[-2]
-                self.current_repo = parts[-1]
+                self.current_owner, self.current_repo = split_repo_url(self.selected_repo_url)
             except IndexError:
                 self.current_owner = ""
                 self.current_repo = ""
@@ -1147,8 +2185,62 @@ class GitHubReleaseManager:
         self.update_download_button_state()
         self.update_remove_button_state()
 
-        # Fetch releases in a new thread to prevent the UI from freezing
-        threading.Thread(target=self.fetch_releases_for_repo, daemon=True).start()
+        # Fetch releases on the pool to prevent the UI from freezing
+        submit_background(self.fetch_releases_for_repo)
+
+    def fetch_release_list(self, owner, repo_name):
+        """
+        Returns the repository's releases, newest first, shaped like the REST
+        API's release objects (tag_name, assets[name, browser_download_url]).
+        With a GITHUB_TOKEN this is one GraphQL request; otherwise one REST page
+        of up to 100 releases. Raises requests.exceptions.RequestException.
+        """
+        if GITHUB_TOKEN:
+            try:
+                response = SESSION.post(
+                    GITHUB_GRAPHQL_URL,
+                    json={'query': RELEASES_GRAPHQL_QUERY, 'variables': {'owner': owner, 'name': repo_name}},
+                    headers={'Authorization': f'bearer {GITHUB_TOKEN}'},
+                    timeout=(5, 30),
+                )
+                nodes = response.json()['data']['repository']['releases']['nodes']
+                return [
+                    {
+                        'tag_name': node['tagName'],
+                        'assets': [
+                            {'name': asset['name'], 'browser_download_url': asset['downloadUrl']}
+                            for asset in node['releaseAssets']['nodes']
+                            if asset['name'].endswith(_ASSET_EXTS)
+                        ],
+                    }
+                    for node in nodes
+                ]
+            except (requests.exceptions.RequestException, ValueError, KeyError, TypeError) as e:
+                print(f"GraphQL release lookup failed, falling back to REST: {e}")
+
+        api_url = f"https://api.github.com/repos/{owner}/{repo_name}/releases?per_page=100"
+        headers = dict(GITHUB_API_HEADERS)
+        cached = self.release_cache.get(api_url)
+        if 'releases' in cached:
+            headers.update(self.release_cache.conditional_headers(api_url))
+        response = SESSION.get(api_url, headers=headers)
+        if response.status_code == 304 and 'releases' in cached:
+            return cached['releases']
+        response.raise_for_status()
+        releases = response.json()
+        trimmed = [
+            {
+                'tag_name': release['tag_name'],
+                'assets': [
+                    {'name': asset['name'], 'browser_download_url': asset['browser_download_url']}
+                    for asset in release.get('assets', ())
+                    if asset['name'].endswith(_ASSET_EXTS)
+                ],
+            }
+            for release in releases
+        ]
+        self.release_cache.store(api_url, response.headers, releases=trimmed)
+        return trimmed
 
     def fetch_releases_for_repo(self):
         """Fetches all releases for the selected repository and updates the dropdown."""
@@ -1156,11 +2248,7 @@ class GitHubReleaseManager:
             return
             
         try:
-            api_url = f"https://api.github.com/repos/{self.current_owner}/{self.current_repo}/releases"
-            response = requests.get(api_url)
-            response.raise_for_status()
-            
-            releases = response.json()
+            releases = self.fetch_release_list(self.current_owner, self.current_repo)
             if not releases:
                 self.master.after(0, lambda: self.release_version_combo.config(values=["No releases found"], state="disabled"))
                 self.master.after(0, lambda: self.release_version_combo.set("No releases found"))
@@ -1183,17 +2271,23 @@ class GitHubReleaseManager:
             self.master.after(0, self.update_download_button_state)
             
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
+            if is_rate_limit_response(e.response):
                 self.master.after(0, self.handle_rate_limit)
             else:
-                self.master.after(0, lambda: self.status_label.config(text=f"Error fetching releases: {e}", fg="#e74c3c"))
-                self.master.after(0, lambda: self.show_custom_messagebox("Network Error", f"Failed to get release list.\nError: {e}", icon_type='error'))
+                self.master.after(0, lambda msg=str(e): self.status_label.config(text=f"Error fetching releases: {msg}", fg="#e74c3c"))
+                self.master.after(0, lambda msg=str(e): self.show_custom_messagebox("Network Error", f"Failed to get release list.\nError: {msg}", icon_type='error'))
                 self.master.after(0, lambda: self.release_version_combo.set("Error fetching releases"))
                 self.master.after(0, lambda: self.release_version_combo.config(values=["Error fetching releases"], state="disabled"))
                 self.master.after(0, self.update_download_button_state)
         except requests.exceptions.RequestException as e:
-            self.master.after(0, lambda: self.status_label.config(text=f"Error fetching releases: {e}", fg="#e74c3c"))
-            self.master.after(0, lambda: self.show_custom_messagebox("Network Error", f"Failed to get release list.\nError: {e}", icon_type='error'))
+            self.master.after(0, lambda msg=str(e): self.status_label.config(text=f"Error fetching releases: {msg}", fg="#e74c3c"))
+            self.master.after(0, lambda msg=str(e): self.show_custom_messagebox("Network Error", f"Failed to get release list.\nError: {msg}", icon_type='error'))
+            self.master.after(0, lambda: self.release_version_combo.set("Error fetching releases"))
+            self.master.after(0, lambda: self.release_version_combo.config(values=["Error fetching releases"], state="disabled"))
+            self.master.after(0, self.update_download_button_state)
+        except Exception as e:
+            # Malformed API payloads (non-JSON body, release without tag_name)
+            self.master.after(0, lambda msg=str(e): self.status_label.config(text=f"Error reading releases: {msg}", fg="#e74c3c"))
             self.master.after(0, lambda: self.release_version_combo.set("Error fetching releases"))
             self.master.after(0, lambda: self.release_version_combo.config(values=["Error fetching releases"], state="disabled"))
             self.master.after(0, self.update_download_button_state)
@@ -1215,12 +2309,8 @@ class GitHubReleaseManager:
         """Updates the download button state based on all prerequisites being met."""
         is_repo_selected = self.selected_repo_url is not None
         is_version_selected = self.selected_release_tag is not None
-        p = self.download_path.lower() if self.download_path else ""
-        is_path_valid = (
-            self.download_path is not None and
-            os.path.isdir(self.download_path) and
-            any(k in p for k in ['mbii', 'supremacy'])
-        )
+        # set_download_path only ever stores a validated MBII folder
+        is_path_valid = self.download_path is not None
         
         if is_repo_selected and is_version_selected and is_path_valid:
             self.download_button.config(state="normal")
@@ -1229,21 +2319,22 @@ class GitHubReleaseManager:
 
     def update_remove_button_state(self):
         """Updates the remove button state based on whether files are recorded for the current repo."""
-        if self.selected_repo_url and self.selected_repo_url in self.client_data and self.client_data[self.selected_repo_url].get('file_list'):
+        if self.selected_repo_url and self.client_data.get(self.selected_repo_url, {}).get('file_list'):
             self.remove_button.config(state="normal")
         else:
             self.remove_button.config(state="disabled")
 
     def on_download(self):
         """Starts the download process in a separate thread."""
-        p = self.download_path.lower() if self.download_path else ""
-
-        if not self.download_path or not any(k in p for k in ['mbii', 'supremacy']):
+        # Re-validate: the folder may have been deleted since it was selected,
+        # and extraction would otherwise recreate an empty tree in its place
+        if not self.download_path or not self.set_download_path(self.download_path):
             self.show_custom_messagebox(
                 "Error",
                 "Please select a valid MBII or SUPREMACY directory first.",
                 icon_type='error'
             )
+            self.update_download_button_state()
             return
 
         if not self.selected_release_tag or self.selected_release_tag not in self.available_releases:
@@ -1255,7 +2346,7 @@ class GitHubReleaseManager:
         self.status_label.config(text=f"Starting download for '{self.current_repo}' version '{self.selected_release_tag}'...", fg="#3498db")
         
         self.create_loading_window()
-        threading.Thread(target=self.download_release_by_tag, daemon=True).start()
+        submit_background(self.download_release_by_tag)
 
     def download_release_by_tag(self):
         """Downloads and extracts the selected release from GitHub."""
@@ -1265,8 +2356,8 @@ class GitHubReleaseManager:
                 self.master.after(0, lambda: self.status_label.config(text="Error: Could not find release data.", fg="#e74c3c"))
                 return
 
-            assets = release_data.get('assets', [])
-            zip_asset = next((asset for asset in assets if asset['name'].endswith('.zip')), None)
+            assets = release_data.get('assets', ())
+            zip_asset = next((asset for asset in assets if asset['name'].endswith(_ASSET_EXTS)), None)
 
             if not zip_asset:
                 self.master.after(0, lambda: self.status_label.config(text="Error: No .zip release asset found for this version.", fg="#e74c3c"))
@@ -1277,23 +2368,52 @@ class GitHubReleaseManager:
             
             self.master.after(0, lambda: self.status_label.config(text=f"Downloading '{asset_name}'...", fg="#3498db"))
             
-            file_response = requests.get(download_url, stream=True)
+            # Only revalidate when this exact release is still installed on disk;
+            # otherwise a 304 would leave the user without the files.
+            installed = self.client_data.get(self.selected_repo_url, {})
+            headers = {}
+            if installed.get('last_tag') == self.selected_release_tag and all(
+                os.path.exists(os.path.join(self.download_path, f)) for f in installed.get('file_list', [])
+            ):
+                headers = self.http_cache.conditional_headers(download_url)
+
+            file_response = SESSION.get(download_url, headers=headers, stream=True)
             file_response.raise_for_status()
 
-            zip_in_memory = io.BytesIO(file_response.content)
+            if file_response.status_code == 304:
+                file_response.close()
+                self.master.after(0, lambda: self.status_label.config(text=f"'{asset_name}' is unchanged, already up to date.", fg="#4CAF50"))
+                self.master.after(0, self.update_remove_button_state)
+                return
+
+            # Spool the archive to a temp file instead of holding it in RAM
+            zip_on_disk = spool_response_to_tempfile(file_response)
 
             self.master.after(0, lambda: self.status_label.config(text=f"Extracting '{asset_name}'...", fg="#3498db"))
             
             file_list = []
-            with zipfile.ZipFile(zip_in_memory, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                zip_ref.extractall(self.download_path)
+            with zip_on_disk, open_spooled_archive(zip_on_disk) as zip_ref:
+                infos = zip_ref.infolist()
+                file_list = [info.filename for info in infos]
+                target_root = os.path.abspath(self.download_path)
+                jobs = []
+                for info in infos:
+                    dest_path = os.path.abspath(os.path.join(target_root, info.filename))
+                    # Refuse entries that would escape the MBII folder (e.g. '../')
+                    if not dest_path.startswith(target_root + os.sep):
+                        continue
+                    if info.is_dir():
+                        os.makedirs(dest_path, exist_ok=True)
+                    else:
+                        jobs.append((info, dest_path))
+                _extract_jobs(zip_ref, jobs)
             
             self.client_data[self.selected_repo_url] = {
                 'last_tag': self.selected_release_tag,
                 'file_list': file_list
             }
             self.save_client_data()
+            self.http_cache.store(download_url, file_response.headers)
 
             self.master.after(0, lambda: self.status_label.config(text=f"Download and extraction complete!", fg="#4CAF50"))
             self.master.after(0, lambda: self.show_custom_messagebox("Success", f"Download and extraction complete! Files saved to:\n{self.download_path}", icon_type='info'))
@@ -1301,24 +2421,23 @@ class GitHubReleaseManager:
             self.master.after(0, self.update_remove_button_state)
 
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
+            if is_rate_limit_response(e.response):
                 self.master.after(0, self.handle_rate_limit)
             else:
-                self.master.after(0, lambda: self.status_label.config(text=f"Network Error: {e}", fg="#e74c3c"))
-                self.master.after(0, lambda: self.show_custom_messagebox("Network Error", f"Failed to download the release. Please check the URL and your internet connection.\nError: {e}", icon_type='error'))
+                self.master.after(0, lambda msg=str(e): self.status_label.config(text=f"Network Error: {msg}", fg="#e74c3c"))
+                self.master.after(0, lambda msg=str(e): self.show_custom_messagebox("Network Error", f"Failed to download the release. Please check the URL and your internet connection.\nError: {msg}", icon_type='error'))
         except requests.exceptions.RequestException as e:
-            self.master.after(0, lambda: self.status_label.config(text=f"Network Error: {e}", fg="#e74c3c"))
-            self.master.after(0, lambda: self.show_custom_messagebox("Network Error", f"Failed to download the release. Please check the URL and your internet connection.\nError: {e}", icon_type='error'))
+            self.master.after(0, lambda msg=str(e): self.status_label.config(text=f"Network Error: {msg}", fg="#e74c3c"))
+            self.master.after(0, lambda msg=str(e): self.show_custom_messagebox("Network Error", f"Failed to download the release. Please check the URL and your internet connection.\nError: {msg}", icon_type='error'))
         except zipfile.BadZipFile:
             self.master.after(0, lambda: self.status_label.config(text="Error: The downloaded file is not a valid zip archive.", fg="#e74c3c"))
             self.master.after(0, lambda: self.show_custom_messagebox("Extraction Error", "The downloaded file is not a valid zip archive.", icon_type='error'))
         except Exception as e:
-            self.master.after(0, lambda: self.status_label.config(text=f"An unexpected error occurred: {e}", fg="#e74c3c"))
-            self.master.after(0, lambda: self.show_custom_messagebox("Error", f"An unexpected error occurred: {e}", icon_type='error'))
+            self.master.after(0, lambda msg=str(e): self.status_label.config(text=f"An unexpected error occurred: {msg}", fg="#e74c3c"))
+            self.master.after(0, lambda msg=str(e): self.show_custom_messagebox("Error", f"An unexpected error occurred: {msg}", icon_type='error'))
         finally:
-            if self.loading_window and self.loading_window.winfo_exists():
-                self.master.after_cancel(self.loading_animation)
-                self.loading_window.destroy()
+            # Tear the loading window down on the Tk thread, never from this worker
+            self.master.after(0, self.close_loading_window)
             self.master.after(0, self.update_download_button_state)
 
     def on_remove(self):
@@ -1327,12 +2446,11 @@ class GitHubReleaseManager:
             self.show_custom_messagebox("Error", "Please select a repository first.", icon_type='error')
             return
 
-        if self.selected_repo_url not in self.client_data or 'file_list' not in self.client_data[self.selected_repo_url]:
+        file_list_to_delete = self.client_data.get(self.selected_repo_url, {}).get('file_list')
+        if file_list_to_delete is None:
             self.show_custom_messagebox("No Files Found", f"No downloaded files recorded for this repository.", icon_type='info')
             return
 
-        file_list_to_delete = self.client_data[self.selected_repo_url]['file_list']
-
         response = self.ask_custom_yesno(
             "Confirm Deletion",
             f"WARNING: This will attempt to delete all {len(file_list_to_delete)} files associated with this release. Proceed?"
@@ -1347,9 +2465,17 @@ class GitHubReleaseManager:
         for filename in file_list_to_delete:
             full_path = os.path.join(self.download_path, filename)
             try:
-                if os.path.isfile(full_path):
+                # Recorded entries are almost always files: unlink directly
+                # instead of stat-ing each one first
+                try:
                     os.remove(full_path)
-                elif os.path.isdir(full_path):
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    # Directories raise IsADirectoryError (PermissionError on Windows)
+                    if not os.path.isdir(full_path):
+                        raise
+                    # rmtree walks the tree with os.scandir
                     shutil.rmtree(full_path)
             except OSError as e:
                 errors.append(f"Could not delete '{full_path}': {e}")
@@ -1395,8 +2521,9 @@ class GitHubReleaseManager:
         if self.icon_path_ico:
             popup.iconbitmap(self.icon_path_ico)
             
-        x = self.master.winfo_x() + self.master.winfo_width() // 2 - 150
-        y = self.master.winfo_y() + self.master.winfo_height() // 2 - 50
+        center_x, center_y = self.master_center()
+        x = center_x - 150
+        y = center_y - 50
         popup.geometry(f'+{x}+{y}')
 
         frame = tk.Frame(popup, bg=self.dark_background_color, padx=20, pady=20)
@@ -1439,8 +2566,9 @@ class GitHubReleaseManager:
         if self.icon_path_ico:
             popup.iconbitmap(self.icon_path_ico)
             
-        x = self.master.winfo_x() + self.master.winfo_width() // 2 - 150
-        y = self.master.winfo_y() + self.master.winfo_height() // 2 - 50
+        center_x, center_y = self.master_center()
+        x = center_x - 150
+        y = center_y - 50
         popup.geometry(f'+{x}+{y}')
 
         frame = tk.Frame(popup, bg=self.dark_background_color, padx=20, pady=20)
@@ -1486,21 +2614,22 @@ class GitHubReleaseManager:
         if self.icon_path_ico:
             self.loading_window.iconbitmap(self.icon_path_ico)
             
-        x = self.master.winfo_x() + self.master.winfo_width() // 2 - 150
-        y = self.master.winfo_y() + self.master.winfo_height() // 2 - 50
+        center_x, center_y = self.master_center()
+        x = center_x - 150
+        y = center_y - 50
         self.loading_window.geometry(f'+{x}+{y}')
 
         tk.Label(self.loading_window, text="Downloading release...", font=("Helvetica", 12), bg=self.dark_background_color, fg=self.text_color).pack(pady=10)
-        self.loading_label = tk.Label(self.loading_window, text=" | ", font=("Helvetica", 16, "bold"), bg=self.dark_background_color, fg=self.text_color)
-        self.loading_label.pack(pady=5)
-        
-        self.update_spinner()
+        # Tk animates an indeterminate progressbar itself, with no Python callback per frame
+        self.loading_progress = ttk.Progressbar(self.loading_window, mode='indeterminate', length=260)
+        self.loading_progress.pack(pady=5)
+        self.loading_progress.start(50)
     
-    def update_spinner(self):
-        """Updates the spinner text on the loading label."""
+    def close_loading_window(self):
+        """Stops the progress animation and destroys the loading popup, if it is open."""
         if self.loading_window and self.loading_window.winfo_exists():
-            self.loading_label.config(text=f' {next(self.spinner)} ')
-            self.loading_animation = self.master.after(100, self.update_spinner)
+            self.loading_progress.stop()
+            self.loading_window.destroy()
 
     def open_server_browser(self):
         """Opens the Server Browser window, passing self as the parent app."""
@@ -1521,6 +2650,81 @@ class GitHubReleaseManager:
 # NEW: ServerBrowser Class (Implements the server list logic)
 # ====================================================================
 
+# Server list row height in pixels, and rows moved per mouse wheel notch
+SERVER_ROW_HEIGHT = 25
+SERVER_WHEEL_ROWS = 3
+# Scraped server fields and the value shown when a server lacks one
+SERVER_FIELD_DEFAULTS = {
+    'hostname': 'Unknown Server',
+    'addr': 'N/A',
+    'mapname': 'N/A',
+    'clients': 'N/A',
+    'passworded': False,
+    'mod': 'N/A',
+    'gametype': 'N/A',
+    'ping': 'N/A',
+}
+# Server list column -> field it sorts by
+SERVER_SORT_FIELDS = {
+    'Name': 'hostname',
+    'Address': 'addr',
+    'Map': 'mapname',
+    'Players': 'clients',
+    'Mod': 'mod',
+    'GameType': 'gametype',
+    'Ping': 'ping',
+}
+
+# Columns sorted by the number they contain rather than alphabetically
+SERVER_NUMERIC_COLUMNS = ('Ping', 'Players')
+
+def build_server_columns(servers):
+    """
+    Transposes the scraped server dicts into one list per field, so filtering,
+    sorting and row building index flat lists instead of calling dict.get
+    per field per server.
+    """
+    return {
+        field: [server.get(field, default) for server in servers]
+        for field, default in SERVER_FIELD_DEFAULTS.items()
+    }
+
+def build_server_row_values(columns):
+    """
+    Precomputes each server's Treeview values after the Name cell from
+    build_server_columns output. The Name cell carries the content status
+    icon, which is only known later, so it is prepended per row.
+    """
+    return list(zip(
+        columns['addr'],
+        columns['mapname'],
+        map(str, columns['clients']),
+        ["🔒" if passworded else "" for passworded in columns['passworded']],
+        columns['mod'],
+        columns['gametype'],
+        map(str, columns['ping']),
+    ))
+
+_LEAD_DIGITS = re.compile(r'\d+')
+
+def _numeric_sort_key(value):
+    """Sort key for Ping/Players cells: their first run of digits as an int, non-numeric cells last."""
+    match = _LEAD_DIGITS.search(str(value))
+    return int(match.group()) if match else sys.maxsize
+
+def build_server_sort_keys(columns):
+    """
+    Precomputes every sortable column's key list from build_server_columns
+    output, so a header click is a single list.sort over index keys with no
+    per-row parsing or lowercasing.
+    """
+    return {
+        col: [_numeric_sort_key(value) for value in columns[field]]
+        if col in SERVER_NUMERIC_COLUMNS else
+        [str(value).lower() for value in columns[field]]
+        for col, field in SERVER_SORT_FIELDS.items()
+    }
+
 class ServerBrowser:
     def __init__(self, parent_app, master, custom_messagebox_func, icon_path_ico, dark_bg, text_color, widget_color, highlight_color, border_color):
 
@@ -1536,6 +2740,13 @@ class ServerBrowser:
             'OpenJK': ['openjk', 'ojk'],
             'All Mods': ['']
         }
+        # One alternation of the sanitized needles per mod, so each server's
+        # mod string is scanned once in C instead of once per needle
+        self.mod_matchers = {}
+        for mod_name, mod_strings in self.mod_name_map.items():
+            needles = [needle for needle in map(self._sanitize_string, mod_strings) if needle]
+            if needles:
+                self.mod_matchers[mod_name] = re.compile('|'.join(map(re.escape, needles)))
 
         self.parent_app = parent_app
         self.window = master
@@ -1555,7 +2766,29 @@ class ServerBrowser:
         # State variables
         self.current_master_url = MASTER_SERVERS["JKHubServers (AppSpot)"]
         self.servers = []
+        # (ip, port) -> (ping result, monotonic time), reused by quick re-refreshes
+        self.ping_cache = {}
         self.filter_popup = None
+        # Per-field lists of self.servers (see build_server_columns)
+        self.columns = build_server_columns([])
+        self.columns['mod_sanitized'] = []
+        self.columns['row_values'] = []
+        self.sort_keys = build_server_sort_keys(self.columns)
+        # Virtualized server list: filtered_indices (into self.servers) is the
+        # model in display order and only the rows in view exist as Treeview
+        # items ("slots")
+        self.filtered_indices = []
+        self.row_cache = []  # server index -> (values, color tag), built on first view
+        # mod filter -> its filtered_indices list for the current servers, so
+        # switching between filters reuses earlier scans (and their sort order)
+        self.filter_cache = {}
+        # hostname -> content status, checked in the background per refresh
+        self.content_statuses = {}
+        self.status_gen = 0
+        self.view_top = 0
+        self.visible_row_count = 0
+        self.slot_count = 0
+        self.slot_rows = []  # (values, color tag) last written to each slot
         self.mod_filter = 'Movie Battles II'  # Start with All Mods to see everything first
 
         # Default sorting state
@@ -1573,54 +2806,45 @@ class ServerBrowser:
         if self.icon_path_ico:
             self.window.iconbitmap(self.icon_path_ico)
             
+        # Start the scrape before building the widgets, so its network round
+        # trip overlaps the style and Treeview setup. Its results reach the
+        # UI through after() callbacks, which only run once this returns.
+        submit_background(self._fetch_servers_thread)
         self.create_widgets()
-        self.fetch_servers()
         self.setup_sorting()
+        self.show_fetching_state()
 
     def on_server_select(self, event):
         """Updates the selected_server_addr when a row is clicked."""
-        selected_item = self.server_tree.focus()
-        if selected_item:
+        selected_items = self.server_tree.selection()
+        # An empty selection only means the selected server scrolled out of
+        # view, so it stays selected
+        if selected_items:
             # The 'Address' column is at index 1 in the values tuple
-            addr = self.server_tree.item(selected_item, 'values')[1]
+            addr = self.server_tree.item(selected_items[0], 'values')[1]
             self.selected_server_addr = addr
             self.status_label.config(text=f"Selected Server: {addr}", fg=self.highlight_color)
-        else:
-            self.selected_server_addr = None
-            self.status_label.config(text="Ready.", fg=self.text_color)
 
-    def _sanitize_string(self, text):
-        """Removes non-alphanumeric characters and converts to lowercase."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _sanitize_string(text):
+        """
+        Removes non-alphanumeric characters and converts to lowercase.
+        Memoized: scraped mod names repeat heavily across servers.
+        """
         if not isinstance(text, str):
             return ""
 
-        text = text.lower()
-        text = text.replace('\xa0', ' ').replace('\u2003', ' ')
-        text = re.sub(r'[^a-z0-9 ]', '', text) 
-        return ' '.join(text.split()).strip()
+        return ' '.join(text.lower().translate(_SANITIZE_TABLE).split())
 
     def sort_column(self, col, reverse):
-        """Sorts Treeview contents when a column header is clicked."""
-        import sys
+        """Sorts the server list when a column header is clicked."""
+        self.sort_col, self.sort_dir = col, reverse
+        # Keys were decorated once per refresh by build_server_sort_keys
+        self.filtered_indices.sort(key=self.sort_keys[col].__getitem__, reverse=reverse)
 
-        l = [(self.server_tree.set(k, col), k) for k in self.server_tree.get_children('')]
-        is_numeric = col in ('Ping', 'Players')
-        
-        if is_numeric:
-            def sort_key(item):
-                value = item[0]
-                if isinstance(value, str):
-                    try:
-                        return int(''.join(filter(str.isdigit, value)) or sys.maxsize)
-                    except ValueError:
-                        return sys.maxsize
-                return value
-            l.sort(key=sort_key, reverse=reverse)
-        else:
-            l.sort(key=lambda t: t[0].lower(), reverse=reverse)
-
-        for index, (val, k) in enumerate(l):
-            self.server_tree.move(k, '', index)
+        self.view_top = 0
+        self.render_server_rows()
 
         self.server_tree.heading(col, command=lambda: self.sort_column(col, not reverse))
         arrow = ' ▼' if reverse else ' ▲' # ▼ = Descending (Highest First), ▲ = Ascending (Lowest First)
@@ -1651,7 +2875,7 @@ class ServerBrowser:
                         background=self.dark_widget_color,
                         foreground=self.text_color, 
                         fieldbackground=self.dark_widget_color,
-                        rowheight=25,
+                        rowheight=SERVER_ROW_HEIGHT,
                         font=('Helvetica', 9))  # Smaller font to fit more
                         
         style.map('Dark.Treeview', 
@@ -1684,6 +2908,7 @@ class ServerBrowser:
         list_vscrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, 
                                        bg=self.border_color, troughcolor=self.dark_widget_color)
         list_vscrollbar.grid(row=0, column=1, sticky="ns")
+        self.list_vscrollbar = list_vscrollbar
 
         list_hscrollbar = tk.Scrollbar(list_frame, orient=tk.HORIZONTAL,
                                        bg=self.border_color, troughcolor=self.dark_widget_color)
@@ -1694,12 +2919,19 @@ class ServerBrowser:
             list_frame, 
             columns=all_columns, 
             show='headings', 
-            yscrollcommand=list_vscrollbar.set,
+            selectmode='browse',
             xscrollcommand=list_hscrollbar.set,
             style="Dark.Treeview"
         )
 
-        list_vscrollbar.config(command=self.server_tree.yview)
+        # The vertical scrollbar moves the window over filtered_indices, not the Treeview
+        list_vscrollbar.config(command=self.on_server_scroll)
+        self.server_tree.bind('<Configure>', self.on_server_tree_resize)
+        self.server_tree.bind('<MouseWheel>', self.on_server_wheel)
+        self.server_tree.bind('<Button-4>', lambda e: self.scroll_server_rows(-SERVER_WHEEL_ROWS))
+        self.server_tree.bind('<Button-5>', lambda e: self.scroll_server_rows(SERVER_WHEEL_ROWS))
+        self.server_tree.bind('<Up>', lambda e: self.move_server_selection(-1))
+        self.server_tree.bind('<Down>', lambda e: self.move_server_selection(1))
         list_hscrollbar.config(command=self.server_tree.xview)
         self.server_tree.grid(row=0, column=0, sticky="nsew") 
 
@@ -1783,9 +3015,6 @@ class ServerBrowser:
         Displays a message box with a warning about server anti-cheat settings
         for a specific platform.
         """
-        root = tk.Tk()
-        root.withdraw()  # Hides the main tkinter window
-
         message_title = "MBII Platform Warning"
         message_text = (
             "Ensure the servers you are joining uses g_AntiCheat 0 in order to "
@@ -1813,9 +3042,26 @@ class ServerBrowser:
         
         server_hostname = selected_server.get('hostname', 'Unknown Server')
         
-        # Check content status
-        content_status = self.check_server_content_status(server_hostname)
-        
+        # Check content status on the pool; the GitHub lookup must not block Tk
+        self.join_button.config(state="disabled")
+        self.status_label.config(text=f"Checking content for {server_hostname}...", fg="#3498db")
+        future = DOWNLOAD_POOL.submit(self.check_server_content_status, server_hostname)
+        future.add_done_callback(lambda f: self._schedule_on_ui(lambda: self._finish_join(selected_server, f.result())))
+
+    def _schedule_on_ui(self, callback):
+        """Marshals a callback from a worker thread onto the Tk thread, if the window still exists."""
+        try:
+            if self.window.winfo_exists():
+                self.window.after(0, callback)
+        except (tk.TclError, RuntimeError):
+            pass
+
+    def _finish_join(self, selected_server, content_status):
+        """Continues joining a server once its content status check has completed."""
+        self.join_button.config(state="normal")
+        self.status_label.config(text=f"Selected Server: {selected_server.get('addr')}", fg=self.highlight_color)
+        server_hostname = selected_server.get('hostname', 'Unknown Server')
+
         # Show appropriate dialog based on status
         if not self.show_content_status_dialog(server_hostname, content_status):
             return  # User cancelled or chose to download/update content
@@ -1853,10 +3099,11 @@ class ServerBrowser:
                 return
 
         # Build command
+        server_addr = selected_server.get('addr')
         command = [
             executable,
             '+set', 'fs_game', 'MBII',
-            '+connect', self.selected_server_addr
+            '+connect', server_addr
         ]
         
         if password:
@@ -1866,9 +3113,9 @@ class ServerBrowser:
             import subprocess
             subprocess.Popen(command, cwd=gamedata_dir)
             if password:
-                self.show_custom_messagebox("Success", f"Launching game and attempting to connect to {self.selected_server_addr} with password")
+                self.show_custom_messagebox("Success", f"Launching game and attempting to connect to {server_addr} with password")
             else:
-                self.show_custom_messagebox("Success", f"Launching game and attempting to connect to {self.selected_server_addr}")
+                self.show_custom_messagebox("Success", f"Launching game and attempting to connect to {server_addr}")
             self.window.destroy()
         except Exception as e:
             self.show_custom_messagebox("Launch Error", f"Failed to launch game: {e}")
@@ -2092,81 +3339,45 @@ class ServerBrowser:
         return password_result
 
     def fetch_servers(self):
+        self.show_fetching_state()
+        submit_background(self._fetch_servers_thread)
+
+    def show_fetching_state(self):
+        """Shows the fetch in progress; the fetch thread re-enables the buttons when done."""
         self.status_label.config(text=f"Fetching servers...", fg="#3498db")
         self.refresh_button.config(state="disabled")
         self.filter_button.config(state="disabled")
-        threading.Thread(target=self._fetch_servers_thread, daemon=True).start()
 
     def _fetch_servers_thread(self):
         """Fetch servers with diagnostic output"""
         JKHUB_SCRAPER_URL = "https://jkhubservers.appspot.com"
-        MAX_PING_THREADS = 20 # Limit the number of concurrent pings
 
         try:
-            print("Using diagnostic web scraper...")
+            logger.debug("Using diagnostic web scraper...")
             new_servers = scrape_jkhub_servers(JKHUB_SCRAPER_URL)
             
-            # --- Step 2: PARALLEL PINGING LOOP ---
-            # Use a ThreadPoolExecutor to run ping_server for many servers at once.
-            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PING_THREADS) as executor:
-                future_to_server = {}
-                
-                # 1. Submit ping tasks to the pool
-                for server in new_servers:
-                    addr = server.get('addr')
-                    ip, port = None, None
-                    
-                    if ':' in addr:
-                        try:
-                            # Extract IP and Port from the 'addr' field
-                            ip, port_str = addr.rsplit(':', 1)
-                            port = int(port_str)
-                        except ValueError:
-                            # Skip server if address parsing fails
-                            server['ping'] = 'Parse Error'
-                            continue
-
-                    if ip and port:
-                        # Submit the ping function call to the thread pool
-                        future = executor.submit(ping_server, ip, port)
-                        future_to_server[future] = server
-                    else:
-                        server['ping'] = 'Invalid Addr'
+            # --- Step 2: BATCH PINGING ---
+            ping_servers_bulk(new_servers, cache=self.ping_cache)
 
-                # 2. Collect results as they complete
-                for future in concurrent.futures.as_completed(future_to_server):
-                    server = future_to_server[future]
-                    try:
-                        ping_result = future.result()
-                        
-                        # Update the 'ping' key based on the result
-                        if ping_result == -1:
-                            server['ping'] = 'Error'
-                        elif ping_result == 999:
-                            server['ping'] = 'Timeout'
-                        else:
-                            server['ping'] = str(ping_result)
-                            
-                    except Exception as exc:
-                        print(f'{server.get("addr")} generated an exception: {exc}')
-                        server['ping'] = 'Error'
-
-            self.servers = new_servers
+            columns = build_server_columns(new_servers)
+            # Sanitized once per refresh, so filter changes only search prebuilt strings
+            columns['mod_sanitized'] = [self._sanitize_string(mod) for mod in columns['mod']]
+            columns['row_values'] = build_server_row_values(columns)
+            sort_keys = build_server_sort_keys(columns)
 
             # --- CRITICAL DIAGNOSTIC LOGGING ---
-            # Print the ping of the first three servers to confirm update success
-            print("\n--- PINGING DIAGNOSTIC (After Pinging) ---")
-            for i, server in enumerate(self.servers[:3]):
-                print(f"Server {i+1} Ping Value in Memory: {server.get('ping', 'Error')}")
-            print("------------------------------------------\n")
+            # Log the ping of the first three servers to confirm update success
+            for i, server in enumerate(new_servers[:3]):
+                logger.debug("Server %d Ping Value in Memory: %s", i + 1, server.get('ping', 'Error'))
             
-            if self.servers:
-                print(f"Scraper returned {len(self.servers)} servers, pinging complete.")
+            if new_servers:
+                logger.debug("Scraper returned %d servers, pinging complete.", len(new_servers))
                 
                 try:
                     if self.window.winfo_exists():
-                        # Step 3: Display results on the main thread
-                        self.window.after(0, self.display_servers)
+                        # Step 3: Swap the new list in and display it on the main
+                        # thread, which is still rendering the old one until then
+                        self.window.after(0, self.display_servers, (new_servers, columns, sort_keys))
                 except tk.TclError:
                     return
             else:
@@ -2193,65 +3404,223 @@ class ServerBrowser:
                 pass
 
 
-    def display_servers(self):
-        """Display servers with improved filtering"""
-        # Clear existing entries
-        for item in self.server_tree.get_children():
-            self.server_tree.delete(item)
+    def display_servers(self, refresh=None):
+        """
+        Display servers with improved filtering.
 
-        print(f"\n--- FILTER DEBUG: Looking for '{self.mod_filter}' ---")
-        mod_strings_to_check = self.mod_name_map.get(self.mod_filter, [])
-        print(f"Filter strings: {mod_strings_to_check}")
+        Args:
+            refresh (tuple): Optional (servers, columns, sort_keys) from a
+                finished fetch. They replace the current list together, here
+                on the Tk thread, so rendering never mixes two refreshes.
+        """
+        logger.debug("Filtering for '%s' with %s", self.mod_filter, self.mod_name_map.get(self.mod_filter, []))
+
+        # Rows, filter results and content statuses only go stale when a
+        # refresh swaps the list in
+        if refresh is not None:
+            self.servers, self.columns, self.sort_keys = refresh
+            self.content_statuses = {}
+            self.filter_cache = {}
+            # Rows are built lazily as they scroll into view
+            self.row_cache = [None] * len(self.servers)
+
+        filtered_indices = self.filter_cache.get(self.mod_filter)
+        if filtered_indices is None:
+            if self.mod_filter == 'All Mods':
+                filtered_indices = list(range(len(self.servers)))
+            else:
+                matcher = self.mod_matchers.get(self.mod_filter)
+                search = matcher.search if matcher else lambda _: None
+                filtered_indices = [
+                    index for index, server_mod_sanitized in enumerate(self.columns['mod_sanitized'])
+                    if search(server_mod_sanitized)
+                ]
+            # Sorted in place later, so returning to this filter resorts an
+            # already ordered list in linear time
+            self.filter_cache[self.mod_filter] = filtered_indices
+
+        logger.debug("Filtered %d -> %d servers", len(self.servers), len(filtered_indices))
+
+        self.filtered_indices = filtered_indices
+        self.start_content_status_checks()
+
+        status_text = f"Loaded {len(self.servers)} servers. Displaying {len(filtered_indices)} for '{self.mod_filter}'"
+        self.status_label.config(text=status_text, fg=self.text_color)
 
-        if self.mod_filter == 'All Mods':
-            filtered_servers = self.servers
+        if filtered_indices:
+            self.sort_column(self.sort_col, self.sort_dir)
         else:
-            filtered_servers = []
-            for server in self.servers:
-                server_mod_raw = server.get('mod', 'n/a')
-                server_mod_sanitized = self._sanitize_string(server_mod_raw)
-                
-                found_match = False
-                for mod_string in mod_strings_to_check:
-                    sanitized_filter = self._sanitize_string(mod_string)
-                    if sanitized_filter and sanitized_filter in server_mod_sanitized:
-                        found_match = True
-                        break
-                
-                if found_match:
-                    filtered_servers.append(server)
+            self.view_top = 0
+            self.render_server_rows()
 
-        print(f"Filtered {len(self.servers)} -> {len(filtered_servers)} servers")
+    def _build_server_row(self, index):
+        """Returns the Treeview values and colour tag for self.servers[index], built on first view."""
+        row = self.row_cache[index]
+        if row is None:
+            hostname = self.columns['hostname'][index]
 
-        # Populate the tree
-        for i, server in enumerate(filtered_servers):
-            hostname = server.get('hostname', 'Unknown Server')
-            addr = server.get('addr', 'N/A')
-            mapname = server.get('mapname', 'N/A')
-            clients = str(server.get('clients', 'N/A'))
+            # Filled in by resolve_content_statuses; unchecked rows show plain white
+            status = self.content_statuses.get(hostname)
+            icon_prefix = self._get_server_icon_prefix(status)
+            color_tag = self._get_content_status_color(status)
 
-            # FIXED: Use 'passworded' instead of 'password'
-            is_passworded = server.get('passworded', False)
-            password_status = "🔒" if is_passworded else ""
+            display_hostname = hostname + '     ' + icon_prefix
 
-            mod = server.get('mod', 'N/A')
-            gametype = server.get('gametype', 'N/A')
-            ping = str(server.get('ping', 'N/A'))
+            # The other cells were built by the fetch thread (see build_server_row_values)
+            row = ((display_hostname,) + self.columns['row_values'][index], color_tag)
+            self.row_cache[index] = row
+        return row
 
-            icon_prefix = self._get_server_icon_prefix(hostname)
-            color_tag = self._get_content_status_color(hostname)
+    def start_content_status_checks(self):
+        """
+        Resolves the content status (and so the colour and download icon) of
+        every listed server on the worker pool, so the list is shown at once
+        and recoloured when the checks finish instead of blocking the UI on
+        GitHub lookups. A newer call supersedes older ones.
+        """
+        self.status_gen += 1
+        hostnames = self.columns['hostname']
+        todo = list(dict.fromkeys(
+            hostnames[index] for index in self.filtered_indices
+            if hostnames[index] not in self.content_statuses
+        ))
+        if todo:
+            submit_background(self.resolve_content_statuses, self.status_gen, todo)
+
+    def resolve_content_statuses(self, gen, hostnames):
+        """
+        Worker: matches every hostname to its repository, then looks up each
+        distinct repository once and fans the result back out to the hostnames
+        that share it. Servers with no associated content are posted to the UI
+        before the GitHub lookup starts.
+        """
+        statuses = {}
+        hostnames_by_url = {}
+        for hostname in hostnames:
+            try:
+                matching_repo = self.parent_app.get_matching_repository(hostname)
+            except Exception as e:
+                print(f"Error checking content status for {hostname}: {e}")
+                statuses[hostname] = 'error_check_failed'
+                continue
+            if matching_repo is None:
+                statuses[hostname] = 'not_found'
+            else:
+                hostnames_by_url.setdefault(matching_repo.get('url'), []).append(hostname)
 
-            display_hostname = hostname + '     ' + icon_prefix
+        if statuses:
+            self._schedule_on_ui(lambda statuses=statuses: self.apply_content_statuses(gen, statuses))
+        if not hostnames_by_url or gen != self.status_gen:
+            return  # Nothing to look up, or a refresh or new filter replaced this run
 
-            self.server_tree.insert('', 'end', iid=f"server_{i}", 
-                                   values=(display_hostname, addr, mapname, clients, password_status, mod, gametype, ping),
-                                   tags=(color_tag,))
+        try:
+            repo_statuses = self.parent_app.get_content_statuses(hostnames_by_url)
+        except Exception as e:
+            print(f"Error checking content status for {len(hostnames_by_url)} repositories: {e}")
+            repo_statuses = {}
+        statuses = {
+            hostname: repo_statuses.get(repo_url, ('error_check_failed', None))[0]
+            for repo_url, url_hostnames in hostnames_by_url.items()
+            for hostname in url_hostnames
+        }
+        self._schedule_on_ui(lambda: self.apply_content_statuses(gen, statuses))
 
-        status_text = f"Loaded {len(self.servers)} servers. Displaying {len(filtered_servers)} for '{self.mod_filter}'"
-        self.status_label.config(text=status_text, fg=self.text_color)
+    def apply_content_statuses(self, gen, statuses):
+        """Stores a chunk of content statuses and repaints the visible rows."""
+        if gen != self.status_gen:
+            return
+        self.content_statuses.update(statuses)
+        self.row_cache = [None] * len(self.servers)
+        self.render_server_rows()
 
-        if filtered_servers:
-            self.sort_column(self.sort_col, self.sort_dir)
+    def render_server_rows(self):
+        """
+        Shows filtered_indices[view_top:view_top + visible_row_count] by
+        rewriting the values of a fixed pool of slot items, so refreshes and
+        scrolling cost O(visible rows) Tk calls rather than O(servers). Slots
+        whose row is unchanged are not touched at all.
+        """
+        indices = self.filtered_indices
+        addrs = self.columns['addr']
+        total = len(indices)
+        count = min(self.visible_row_count, total)
+        self.view_top = top = max(0, min(self.view_top, total - count))
+
+        slot_rows = self.slot_rows
+        while self.slot_count < count:
+            self.server_tree.insert('', 'end', iid=f"slot_{self.slot_count}")
+            slot_rows.append(None)
+            self.slot_count += 1
+        if self.slot_count > count:
+            # One delete call for every surplus slot
+            self.server_tree.delete(*(f"slot_{i}" for i in range(count, self.slot_count)))
+            del slot_rows[count:]
+            self.slot_count = count
+
+        selected = ()
+        for i in range(count):
+            index = indices[top + i]
+            row = self._build_server_row(index)
+            if row != slot_rows[i]:
+                values, color_tag = slot_rows[i] = row
+                self.server_tree.item(f"slot_{i}", values=values, tags=(color_tag,))
+            if self.selected_server_addr and addrs[index] == self.selected_server_addr:
+                selected = (f"slot_{i}",)
+
+        # Keep the highlight on the selected server, not on the slot it used to occupy
+        if self.server_tree.selection() != selected:
+            self.server_tree.selection_set(selected)
+        if selected:
+            self.server_tree.focus(selected[0])
+
+        if total:
+            self.list_vscrollbar.set(top / total, (top + count) / total)
+        else:
+            self.list_vscrollbar.set(0, 1)
+
+    def scroll_server_rows(self, delta):
+        """Moves the visible window delta rows down (negative scrolls up)."""
+        self.view_top += delta
+        self.render_server_rows()
+        return "break"
+
+    def on_server_scroll(self, *args):
+        """Scrollbar command: translates 'moveto'/'scroll' into a new view_top."""
+        if args[0] == 'moveto':
+            self.view_top = int(float(args[1]) * len(self.filtered_indices))
+            self.render_server_rows()
+        elif args[0] == 'scroll':
+            step = max(1, self.visible_row_count) if args[2] == 'pages' else 1
+            self.scroll_server_rows(int(args[1]) * step)
+
+    def on_server_wheel(self, event):
+        """Windows/macOS mouse wheel over the server list."""
+        return self.scroll_server_rows(-SERVER_WHEEL_ROWS if event.delta > 0 else SERVER_WHEEL_ROWS)
+
+    def on_server_tree_resize(self, event):
+        """Resizes the slot pool to the number of rows that fit in the Treeview."""
+        # One row height is left for the column headings
+        rows = max(1, event.height // SERVER_ROW_HEIGHT - 1)
+        if rows != self.visible_row_count:
+            self.visible_row_count = rows
+            self.render_server_rows()
+
+    def move_server_selection(self, delta):
+        """Up/Down keys: moves the selection through the whole list, scrolling as needed."""
+        indices = self.filtered_indices
+        if not indices:
+            return "break"
+        addrs = self.columns['addr']
+        current = next((i for i, index in enumerate(indices) if addrs[index] == self.selected_server_addr), None)
+        position = self.view_top if current is None else max(0, min(len(indices) - 1, current + delta))
+        if position < self.view_top:
+            self.view_top = position
+        elif position >= self.view_top + self.visible_row_count:
+            self.view_top = position - self.visible_row_count + 1
+        self.selected_server_addr = addrs[indices[position]]
+        self.status_label.config(text=f"Selected Server: {self.selected_server_addr}", fg=self.highlight_color)
+        self.render_server_rows()
+        return "break"
 
     def open_filter_popup(self):
         """Opens filter popup"""
@@ -2316,8 +3685,8 @@ class ServerBrowser:
         self.servers_config_file = os.path.join(os.path.dirname(sys.argv[0]), "cache", "servers.json")
         if os.path.exists(self.servers_config_file):
             try:
-                with open(self.servers_config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.servers_config_file, 'rb') as f:
+                    return _json_loads(f.read())
             except Exception as e:
                 print(f"Error reading servers config: {e}")
                 return {}
@@ -2328,8 +3697,8 @@ class ServerBrowser:
         self.repos_config_file = os.path.join(os.path.dirname(sys.argv[0]), "cache", "repositories.json")
         if os.path.exists(self.repos_config_file):
             try:
-                with open(self.repos_config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.repos_config_file, 'rb') as f:
+                    return _json_loads(f.read())
             except Exception as e:
                 print(f"Error reading repositories config: {e}")
                 return []
@@ -2340,8 +3709,8 @@ class ServerBrowser:
         self.client_config_file = os.path.join(os.path.dirname(sys.argv[0]), "cache", "client.json")
         if os.path.exists(self.client_config_file):
             try:
-                with open(self.client_config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.client_config_file, 'rb') as f:
+                    return _json_loads(f.read())
             except Exception as e:
                 print(f"Error reading client config: {e}")
                 return {}
@@ -2368,7 +3737,7 @@ class ServerBrowser:
             status, latest_tag = self.parent_app.get_content_status(matching_repo)
 
             # Accesses data from the Manager
-            local_tag = self.parent_app.client_data.get(matching_repo.get('url'), {}).get('last_tag')
+            local_tag = self.parent_app.last_tags.get(matching_repo.get('url'))
             
             # Case 2: Success. Returns the full dictionary.
             return {
@@ -2406,7 +3775,7 @@ class ServerBrowser:
             status, latest_tag = self.parent_app.get_content_status(matching_repo)
 
             # 3. Accesses data from the Manager
-            local_tag = self.parent_app.client_data.get(matching_repo.get('url'), {}).get('last_tag')
+            local_tag = self.parent_app.last_tags.get(matching_repo.get('url'))
             
             # Case 2: Success. Returns the full dictionary.
             return {
@@ -2530,14 +3899,12 @@ class ServerBrowser:
         popup.wait_window()
         return result
 
-    def _get_content_status_color(self, server_hostname):
+    def _get_content_status_color(self, status):
         """
-        Determines the required color tag based on content status.
+        Determines the required color tag based on a content status from
+        check_server_content_status (None while it is still being checked).
         Returns 'red_status', 'green_status', 'orange_status', or 'white_status'.
         """
-        content_status = self.check_server_content_status(server_hostname)
-        status = content_status['status']
-        
         if status == 'outdated':
             return 'red_status'
         elif status == 'up-to-date':
@@ -2545,18 +3912,14 @@ class ServerBrowser:
         elif status == 'not_downloaded':
             # FIX: If not downloaded, the row status is orange
             return 'orange_status' 
-        else: # 'not_found', 'error_check_failed'
+        else: # 'not_found', 'error_check_failed', or not checked yet
             return 'white_status'
 
-    def _get_server_icon_prefix(self, server_hostname):
+    def _get_server_icon_prefix(self, status):
         """
         Returns a symbol if the server requires content that is not downloaded, 
         otherwise returns an empty string.
         """
-        # Uses the crash-proof check_server_content_status method
-        content_status = self.check_server_content_status(server_hostname)
-        status = content_status['status']
-        
         # We will use a downward arrow symbol to signify "Download Required"
         if status == 'not_downloaded':
             return "[↓] " 
@@ -2574,5 +3937,8 @@ if __name__ == '__main__':
     root = tk.Tk()
     # Apply global background color before main app takes over
     root.configure(bg="#121212")
-    GitHubReleaseManager(root)
-    root.mainloop()
\ No newline at end of file
+    app = GitHubReleaseManager(root)
+    root.mainloop()
+    # Reached after a rate-limit quit; the close button exits in on_close
+    app.flush_client_data()
+    SESSION.close()
\ No newline at end of file
@@ -0,0 +1,56 @@
+import concurrent.futures
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+try:
+    import PIL  # noqa: F401  (mbupdater exits at import without Pillow)
+except ImportError:
+    PIL = None
+
+
+# mbupdater binds winmm through ctypes.windll at import time
+@unittest.skipUnless(sys.platform == "win32", "mbupdater only imports on Windows")
+@unittest.skipIf(PIL is None, "Pillow is not installed")
+class ApplyBackgroundImageTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        import tkinter as tk
+        try:
+            cls.root = tk.Tk()
+        except tk.TclError as e:
+            raise unittest.SkipTest(f"Tk needs a display: {e}")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def test_draws_image_and_overlay_sized_to_the_photo(self):
+        import tkinter as tk
+        import mbupdater
+
+        manager = mbupdater.GitHubReleaseManager.__new__(mbupdater.GitHubReleaseManager)
+        manager.dark_background_color = mbupdater.DARK_BACKGROUND_COLOR
+        manager._photo_cache = {}
+        canvas = tk.Canvas(self.root)
+
+        image_path = os.path.join(ROOT, "background.png")
+        size = (502, 351)
+        future = concurrent.futures.Future()
+        future.set_result(mbupdater.load_resized_image(image_path, size))
+
+        manager.apply_background_image(canvas, future, image_path, size)
+
+        image_item, overlay_item = canvas.find_all()
+        self.assertEqual(canvas.type(image_item), "image")
+        self.assertEqual(canvas.type(overlay_item), "rectangle")
+        self.assertEqual(canvas.coords(overlay_item), [0.0, 0.0, 502.0, 351.0])
+        self.assertEqual((manager.bg_image_ref.width(), manager.bg_image_ref.height()), size)
+
+
+if __name__ == "__main__":
+    unittest.main()